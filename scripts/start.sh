@@ -26,7 +26,7 @@ fi
 # Check for venv
 if [ ! -d "$PROJECT_DIR/venv" ]; then
     echo "ERROR: Python venv not found. Create it with:"
-    echo "  python3 -m venv venv && source venv/bin/activate && pip install fastapi uvicorn openai python-dotenv"
+    echo "  python3 -m venv venv && source venv/bin/activate && pip install -r requirements.txt"
     exit 1
 fi
 
@@ -34,7 +34,10 @@ fi
 echo "Starting Python backend..."
 source "$PROJECT_DIR/venv/bin/activate"
 cd "$PROJECT_DIR"
+# Single worker: god state (command queue, tick lock, memories) is in-process.
+# uvloop + httptools replace the stock asyncio loop and HTTP parser.
 nohup uvicorn server.main:app --host 127.0.0.1 --port 8000 \
+    --loop uvloop --http httptools --workers 1 \
     > "$LOG_DIR/backend.log" 2>&1 &
 echo $! > "$PROJECT_DIR/.backend.pid"
 echo "  Backend started (PID: $(cat "$PROJECT_DIR/.backend.pid"))"
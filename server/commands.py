@@ -18,10 +18,10 @@ from server.schematics import search_schematics, build_schematic_command
 logger = logging.getLogger("minecraft-god")
 
 # Allowlisted command prefixes — anything not starting with one of these is dropped
-ALLOWED_COMMANDS = {
+ALLOWED_COMMANDS = frozenset({
     "summon", "say", "tellraw", "weather", "effect", "tp", "teleport",
     "give", "clear", "playsound", "time", "difficulty", "setblock", "fill",
-}
+})
 
 # Chat prefixes for each god — used by tellraw for attributed messages
 GOD_CHAT_STYLE = {
@@ -32,19 +32,19 @@ GOD_CHAT_STYLE = {
 }
 
 # Dangerous items that must never be given to players
-BLOCKED_ITEMS = {
+BLOCKED_ITEMS = frozenset({
     "command_block", "repeating_command_block", "chain_command_block",
     "command_block_minecart", "barrier", "structure_block", "structure_void",
     "light", "allow", "deny", "border_block", "jigsaw",
     "bedrock", "end_portal_frame", "end_portal",
-}
+})
 
 # Valid target selectors — only @a (all players) and @s (self) are allowed
 # @e (all entities) and @r (random) are too broad
-ALLOWED_SELECTORS = {"@a", "@s", "@p"}
+ALLOWED_SELECTORS = frozenset({"@a", "@s", "@p"})
 
 # Valid mob types the gods can summon
-VALID_MOBS = {
+VALID_MOBS = frozenset({
     # Hostile
     "zombie", "skeleton", "creeper", "spider", "cave_spider", "silverfish",
     "enderman", "witch", "phantom", "slime", "magma_cube", "blaze",
@@ -56,17 +56,22 @@ VALID_MOBS = {
     "axolotl", "frog", "turtle",
     # Special
     "lightning_bolt", "villager", "wandering_trader",
-}
+})
 
 # Valid status effects
-VALID_EFFECTS = {
+VALID_EFFECTS = frozenset({
     "speed", "slowness", "haste", "mining_fatigue", "strength",
     "instant_health", "instant_damage", "jump_boost", "nausea",
     "regeneration", "resistance", "fire_resistance", "water_breathing",
     "invisibility", "blindness", "night_vision", "hunger", "weakness",
     "poison", "levitation", "slow_falling", "darkness", "absorption",
     "saturation", "glowing",
-}
+})
+
+# Listings for the error messages fed back to the LLM — the sets never change
+_VALID_MOBS_TEXT = ", ".join(sorted(VALID_MOBS))
+_VALID_EFFECTS_TEXT = ", ".join(sorted(VALID_EFFECTS))
+_ALLOWED_SELECTORS_TEXT = ", ".join(sorted(ALLOWED_SELECTORS))
 
 # Regex for valid player names (Java Edition: alphanumeric + underscores, 3-16 chars)
 _PLAYER_NAME_RE = re.compile(r"^[a-zA-Z0-9_]{3,16}$")
@@ -82,6 +87,9 @@ _SOUND_RE = re.compile(r"^[a-z0-9_.:/-]+$")
 
 _whitelist_cache: set[str] | None = None
 _whitelist_mtime: float = 0
+# (whitelist set, its lowercased names) — get_whitelist_names returns the same
+# set object until the file changes, so identity tells us when to rebuild
+_whitelist_lower: tuple[set[str], frozenset[str]] | None = None
 
 
 def get_whitelist_names() -> set[str]:
@@ -101,6 +109,14 @@ def get_whitelist_names() -> set[str]:
         return set()
 
 
+def _lowercase_names(whitelist: set[str]) -> frozenset[str]:
+    """Lowercased whitelist names for case-insensitive lookups, built once per whitelist."""
+    global _whitelist_lower
+    if _whitelist_lower is None or _whitelist_lower[0] is not whitelist:
+        _whitelist_lower = (whitelist, frozenset(n.lower() for n in whitelist))
+    return _whitelist_lower[1]
+
+
 def _check_player_target(target: str, whitelist: set[str]) -> None:
     """Validate a player name or target selector against the whitelist.
 
@@ -112,10 +128,9 @@ def _check_player_target(target: str, whitelist: set[str]) -> None:
     if not _PLAYER_NAME_RE.match(target):
         raise ValueError(
             f"Invalid player target '{target}'. "
-            f"Use a player name or one of: {', '.join(sorted(ALLOWED_SELECTORS))}")
+            f"Use a player name or one of: {_ALLOWED_SELECTORS_TEXT}")
     if whitelist:
-        whitelist_lower = {n.lower(): n for n in whitelist}
-        if target.lower() not in whitelist_lower:
+        if target.lower() not in _lowercase_names(whitelist):
             raise ValueError(
                 f"Player '{target}' is not on the whitelist. "
                 f"Whitelisted players: {', '.join(sorted(whitelist))}")
@@ -146,7 +161,7 @@ class SummonMobParams(BaseModel):
         if v not in VALID_MOBS:
             raise ValueError(
                 f"Invalid mob type '{v}'. "
-                f"Valid types: {', '.join(sorted(VALID_MOBS))}")
+                f"Valid types: {_VALID_MOBS_TEXT}")
         return v
 
     @field_validator('location')
@@ -202,7 +217,7 @@ class GiveEffectParams(BaseModel):
         if v not in VALID_EFFECTS:
             raise ValueError(
                 f"Invalid effect '{v}'. "
-                f"Valid effects: {', '.join(sorted(VALID_EFFECTS))}")
+                f"Valid effects: {_VALID_EFFECTS_TEXT}")
         return v
 
     @field_validator('duration', mode='before')
@@ -450,60 +465,60 @@ def _translate_one(name: str, args: dict, source: str = "kind_god",
     wl = whitelist or set()
 
     if name == "do_nothing":
-        params = DoNothingParams(**args)
+        params = DoNothingParams.model_validate(args)
         logger.info(f"God chose to do nothing: {params.reason}")
         return None
 
     if name == "send_message":
-        params = SendMessageParams(**args)
+        params = SendMessageParams.model_validate(args)
         if params.target_player is not None:
             _check_player_target(params.target_player, wl)
         return _send_message(params, source)
     elif name == "summon_mob":
-        params = SummonMobParams(**args)
+        params = SummonMobParams.model_validate(args)
         if params.near_player is not None:
             _check_player_target(params.near_player, wl)
         return _summon_mob(params)
     elif name == "change_weather":
-        params = ChangeWeatherParams(**args)
+        params = ChangeWeatherParams.model_validate(args)
         return _change_weather(params)
     elif name == "give_effect":
-        params = GiveEffectParams(**args)
+        params = GiveEffectParams.model_validate(args)
         _check_player_target(params.target_player, wl)
         return _give_effect(params)
     elif name == "set_time":
-        params = SetTimeParams(**args)
+        params = SetTimeParams.model_validate(args)
         return _set_time(params)
     elif name == "give_item":
-        params = GiveItemParams(**args)
+        params = GiveItemParams.model_validate(args)
         _check_player_target(params.player, wl)
         return _give_item(params)
     elif name == "clear_item":
-        params = ClearItemParams(**args)
+        params = ClearItemParams.model_validate(args)
         _check_player_target(params.player, wl)
         return _clear_item(params)
     elif name == "strike_lightning":
-        params = StrikeLightningParams(**args)
+        params = StrikeLightningParams.model_validate(args)
         _check_player_target(params.near_player, wl)
         return _strike_lightning(params)
     elif name == "play_sound":
-        params = PlaySoundParams(**args)
+        params = PlaySoundParams.model_validate(args)
         if params.target_player is not None:
             _check_player_target(params.target_player, wl)
         return _play_sound(params)
     elif name == "set_difficulty":
-        params = SetDifficultyParams(**args)
+        params = SetDifficultyParams.model_validate(args)
         return _set_difficulty(params)
     elif name == "teleport_player":
-        params = TeleportPlayerParams(**args)
+        params = TeleportPlayerParams.model_validate(args)
         _check_player_target(params.player, wl)
         return _teleport_player(params)
     elif name == "assign_mission":
-        params = AssignMissionParams(**args)
+        params = AssignMissionParams.model_validate(args)
         _check_player_target(params.player, wl)
         return _assign_mission(params, source)
     elif name == "build_schematic":
-        params = BuildSchematicParams(**args)
+        params = BuildSchematicParams.model_validate(args)
         return _build_schematic(params, player_context=player_context,
                                 requesting_player=requesting_player,
                                 whitelist=wl)
@@ -547,16 +562,20 @@ def _wrap_message_lines(text: str, width: int = _CHAT_LINE_WIDTH) -> list[str]:
         paragraph = paragraph.strip()
         if not paragraph:
             continue
-        # Word-wrap long paragraphs
-        while len(paragraph) > width:
+        # Word-wrap long paragraphs, walking an index rather than re-slicing
+        # the remaining tail after every line
+        start, end = 0, len(paragraph)
+        while end - start > width:
             # Find last space within width
-            split_at = paragraph.rfind(" ", 0, width)
+            split_at = paragraph.rfind(" ", start, start + width)
             if split_at == -1:
-                split_at = width  # no space found, hard-break
-            lines.append(paragraph[:split_at].rstrip())
-            paragraph = paragraph[split_at:].lstrip()
-        if paragraph:
-            lines.append(paragraph)
+                split_at = start + width  # no space found, hard-break
+            lines.append(paragraph[start:split_at].rstrip())
+            start = split_at
+            while start < end and paragraph[start].isspace():
+                start += 1
+        if start < end:
+            lines.append(paragraph[start:])
     return lines
 
 
@@ -616,13 +635,12 @@ def _send_message(params: SendMessageParams, source: str = "kind_god") -> dict |
 
 
 def _summon_mob(params: SummonMobParams) -> list[dict] | None:
-    commands = []
-    for _ in range(params.count):
-        cmd = _cmd(f"summon minecraft:{params.mob_type} {params.location}",
-                   target_player=params.near_player)
-        if cmd:
-            commands.append(cmd)
-    return commands
+    # Every copy is the same command — validate it once, then repeat it
+    cmd = _cmd(f"summon minecraft:{params.mob_type} {params.location}",
+               target_player=params.near_player)
+    if not cmd:
+        return []
+    return [dict(cmd) for _ in range(params.count)]
 
 
 def _change_weather(params: ChangeWeatherParams) -> dict | None:
@@ -14,6 +14,9 @@ GOD_MODEL = os.getenv("GOD_MODEL", "glm-5")
 
 # God tick settings
 GOD_TICK_INTERVAL = int(os.getenv("GOD_TICK_INTERVAL", "120"))
+# Idle LLM connections outlive one tick interval, so back-to-back active
+# ticks reuse the pooled connection instead of reconnecting
+LLM_KEEPALIVE_EXPIRY = GOD_TICK_INTERVAL + 30
 MAX_TOOL_CALLS_PER_RESPONSE = 5
 
 # Deep God trigger thresholds
@@ -36,16 +39,16 @@ MEMORY_MAX_ENTRIES = int(os.getenv("MEMORY_MAX_ENTRIES", "15"))
 MEMORY_CONSOLIDATION_INTERVAL_SECONDS = int(os.getenv("MEMORY_CONSOLIDATION_INTERVAL", str(3 * 3600)))  # default 3 hours
 
 # Prayer keywords that trigger immediate Kind God response
-PRAYER_KEYWORDS = {"god", "please", "help", "pray", "prayer", "mercy", "save", "lord"}
+PRAYER_KEYWORDS = frozenset({"god", "please", "help", "pray", "prayer", "mercy", "save", "lord"})
 
 # Herald keywords — trigger the Herald, NOT the Kind God
-HERALD_KEYWORDS = {"herald", "bard", "guide"}
+HERALD_KEYWORDS = frozenset({"herald", "bard", "guide"})
 
 # Dig God keywords — trigger the God of Digging, NOT the Kind God
-DIG_KEYWORDS = {"dig", "hole", "tunnel", "excavate", "shaft", "staircase"}
+DIG_KEYWORDS = frozenset({"dig", "hole", "tunnel", "excavate", "shaft", "staircase"})
 
 # Remember keywords — trigger player-initiated memory consolidation
-REMEMBER_KEYWORDS = {"remember"}
+REMEMBER_KEYWORDS = frozenset({"remember"})
 
 # Dig God size caps (per dimension)
 DIG_MAX_WIDTH = 32
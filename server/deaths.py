@@ -9,6 +9,7 @@ import logging
 import shutil
 from datetime import datetime, timezone
 from pathlib import Path
+from threading import Lock
 
 from server.config import MEMORY_DIR
 
@@ -23,6 +24,12 @@ class DeathMemorial:
 
     def __init__(self):
         self.deaths: dict[str, list[dict]] = {}
+        # record_death runs in a worker thread (off the event loop) — _lock
+        # guards self.deaths for it and for the readers below, which run on
+        # the event loop; _save_lock keeps concurrent saves in order without
+        # holding _lock for the disk write
+        self._lock = Lock()
+        self._save_lock = Lock()
         self._load()
 
     def _load(self):
@@ -39,8 +46,11 @@ class DeathMemorial:
                 self.deaths = {}
 
     def _save(self):
-        DEATH_FILE.parent.mkdir(parents=True, exist_ok=True)
-        DEATH_FILE.write_text(json.dumps(self.deaths, indent=2))
+        with self._save_lock:
+            with self._lock:
+                data = json.dumps(self.deaths, indent=2)
+            DEATH_FILE.parent.mkdir(parents=True, exist_ok=True)
+            DEATH_FILE.write_text(data)
 
     def record_death(self, event: dict):
         """Record a player death from an entity_die event."""
@@ -60,36 +70,36 @@ class DeathMemorial:
             "killed_by": event.get("damagingEntity", "").replace("minecraft:", "") or None,
         }
 
-        if player not in self.deaths:
-            self.deaths[player] = []
-        self.deaths[player].append(record)
+        with self._lock:
+            if player not in self.deaths:
+                self.deaths[player] = []
+            self.deaths[player].append(record)
 
-        # Trim to most recent N
-        if len(self.deaths[player]) > MAX_DEATHS_PER_PLAYER:
-            self.deaths[player] = self.deaths[player][-MAX_DEATHS_PER_PLAYER:]
+            # Trim to most recent N
+            if len(self.deaths[player]) > MAX_DEATHS_PER_PLAYER:
+                self.deaths[player] = self.deaths[player][-MAX_DEATHS_PER_PLAYER:]
 
         self._save()
         logger.info(f"Death recorded: {player} died from {record['cause']} at ({record['x']}, {record['y']}, {record['z']})")
 
     def get_player_deaths(self, player: str) -> list[dict]:
-        """Get all death records for a player."""
-        return self.deaths.get(player, [])
+        """Get all death records for a player (a copy, safe to iterate)."""
+        with self._lock:
+            return list(self.deaths.get(player, []))
 
     def get_total_deaths(self, player: str) -> int:
         """Get total death count for a player."""
-        return len(self.deaths.get(player, []))
+        with self._lock:
+            return len(self.deaths.get(player, []))
+
+    def death_counts(self) -> dict[str, int]:
+        """Death count per player."""
+        with self._lock:
+            return {p: len(d) for p, d in self.deaths.items()}
 
     def get_nearby_deaths(self, player: str, x: int, y: int, z: int, radius: int = 32) -> list[dict]:
         """Get deaths for a player that occurred near a given location."""
-        nearby = []
-        for death in self.deaths.get(player, []):
-            dx = (death.get("x", 0) or 0) - x
-            dy = (death.get("y", 0) or 0) - y
-            dz = (death.get("z", 0) or 0) - z
-            dist_sq = dx * dx + dy * dy + dz * dz
-            if dist_sq <= radius * radius:
-                nearby.append(death)
-        return nearby
+        return _deaths_near(self.get_player_deaths(player), x, y, z, radius)
 
     def format_for_summary(self, player_name: str, player_x: int, player_y: int, player_z: int) -> str:
         """Format death history for inclusion in the event summary."""
@@ -108,7 +118,7 @@ class DeathMemorial:
         lines.append(f"    Last death: {cause_str} at ({last['x']}, {last['y']}, {last['z']})")
 
         # Deaths near current location
-        nearby = self.get_nearby_deaths(player_name, player_x, player_y, player_z, radius=32)
+        nearby = _deaths_near(deaths, player_x, player_y, player_z, radius=32)
         if nearby:
             lines.append(f"    Deaths near current location: {len(nearby)}")
             # Show the most recent nearby death cause
@@ -130,3 +140,16 @@ class DeathMemorial:
         lines.append(f"    Top causes: {cause_summary}")
 
         return "\n".join(lines)
+
+
+def _deaths_near(deaths: list[dict], x: int, y: int, z: int, radius: int) -> list[dict]:
+    """Filter death records to those within radius of a location."""
+    nearby = []
+    for death in deaths:
+        dx = (death.get("x", 0) or 0) - x
+        dy = (death.get("y", 0) or 0) - y
+        dz = (death.get("z", 0) or 0) - z
+        dist_sq = dx * dx + dy * dy + dz * dz
+        if dist_sq <= radius * radius:
+            nearby.append(death)
+    return nearby
@@ -20,6 +20,7 @@ from server.config import (
 )
 from server.llm import client
 from server.commands import translate_tool_calls
+from server.events import find_player
 
 logger = logging.getLogger("minecraft-god")
 
@@ -219,11 +220,13 @@ class DeepGod:
         players_in_nether = False
 
         if player_status and player_status.get("players"):
-            for p in player_status["players"]:
-                # If a prayer triggered this tick, only consider the praying player
-                if praying_player and p.get("name", "").lower() != praying_player.lower():
-                    continue
-
+            # If a prayer triggered this tick, only consider the praying player
+            if praying_player:
+                praying = find_player(player_status, praying_player)
+                considered = [praying] if praying else []
+            else:
+                considered = player_status["players"]
+            for p in considered:
                 loc = p.get("location", {})
                 y = loc.get("y", 64)
                 dim = p.get("dimension", "")
@@ -238,9 +241,11 @@ class DeepGod:
         # Check for deep ore mining in events
         deep_ores_mined = False
         if event_summary:
+            # Case-fold the summary once rather than once per ore
+            summary_lower = event_summary.lower()
             for ore in DEEP_ORES:
                 ore_clean = ore.replace("minecraft:", "")
-                if ore_clean in event_summary.lower():
+                if ore_clean in summary_lower:
                     deep_ores_mined = True
                     break
 
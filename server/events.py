@@ -1,6 +1,6 @@
 import logging
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from threading import Lock
 
 from server.prayer_queue import is_divine_request
@@ -8,14 +8,34 @@ from server.prayer_queue import is_divine_request
 logger = logging.getLogger("minecraft-god")
 
 
+def find_player(player_status: dict | None, name: str) -> dict | None:
+    """Return the entry for `name` (case-insensitive) from a status beacon, if present."""
+    if not player_status:
+        return None
+    name_lower = name.lower()
+    for p in player_status.get("players", ()):
+        if p.get("name", "").lower() == name_lower:
+            return p
+    return None
+
+
 class EventBuffer:
     """Accumulates game events and drains them as summarized text for the LLM."""
 
     # Player status older than this is considered stale (no one online)
     _STATUS_STALE_SECONDS = 120
+    # Cap on buffered events between drains — if ticks stall (or a player
+    # strip-mines for a whole interval) the oldest events fall off instead
+    # of growing without bound
+    _MAX_EVENTS = 5000
+    # How many recent chat lines a repeat is checked against
+    _CHAT_DEDUP_WINDOW = 32
 
     def __init__(self):
-        self._events: list[dict] = []
+        self._events: deque[dict] = deque(maxlen=self._MAX_EVENTS)
+        # (player, message) of chat buffered since the last drain, for
+        # dropping spammed repeats
+        self._recent_chat_keys: deque[tuple] = deque(maxlen=self._CHAT_DEDUP_WINDOW)
         self._lock = Lock()
         self._latest_player_status: dict | None = None
         self._player_status_time: float = 0
@@ -27,8 +47,19 @@ class EventBuffer:
                 self._latest_player_status = event
                 self._player_status_time = time.time()
                 self._stale_logged = False
-            else:
-                self._events.append(event)
+                return
+            if event.get("type") == "chat":
+                # A player repeating the same line only costs prompt tokens —
+                # the god already sees it once this interval
+                key = (event.get("player"), event.get("message"))
+                if key in self._recent_chat_keys:
+                    return
+                self._recent_chat_keys.append(key)
+            self._events.append(event)
+
+    def has_events(self) -> bool:
+        """Cheap check for buffered events — lets the tick skip idle cycles."""
+        return bool(self._events)
 
     def get_recent_chat(self, limit: int = 10) -> list[dict]:
         """Return recent chat events (non-destructive) for prayer context snapshots."""
@@ -59,8 +90,9 @@ class EventBuffer:
         divine request queue instead.
         """
         with self._lock:
-            events = self._events.copy()
+            events = list(self._events)
             self._events.clear()
+            self._recent_chat_keys.clear()
             player_status = self._latest_player_status
 
         if filter_divine:
@@ -90,30 +122,31 @@ class EventBuffer:
                 facing = p.get("facing", "?")
                 look_v = p.get("lookingVertical", "ahead")
                 biome = p.get("biome", "?")
-                info = (
+                # Built as fragments and joined once rather than grown with +=
+                info = [
                     f"  - {p['name']}: at ({loc.get('x', '?')}, {loc.get('y', '?')}, {loc.get('z', '?')}) "
                     f"in {p.get('dimension', '?')} ({biome}), facing {facing} looking {look_v}, "
                     f"health={p.get('health', '?')}/{p.get('maxHealth', '?')}, "
                     f"food={p.get('foodLevel', '?')}/20, level={p.get('level', '?')}"
-                )
+                ]
                 # Armor
-                armor = [a.replace("minecraft:", "") for a in p.get("armor", []) if a != "minecraft:air"]
+                armor = [a.removeprefix("minecraft:") for a in p.get("armor", []) if a != "minecraft:air"]
                 if armor:
-                    info += f"\n    Armor: {', '.join(armor)}"
+                    info.append(f"\n    Armor: {', '.join(armor)}")
                 else:
-                    info += "\n    Armor: none"
+                    info.append("\n    Armor: none")
                 # Held item
                 if p.get("mainHand"):
-                    info += f" | Holding: {p['mainHand'].replace('minecraft:', '')}"
+                    info.append(f" | Holding: {p['mainHand'].removeprefix('minecraft:')}")
                 # Full inventory
                 inventory = p.get("inventory", {})
                 if inventory:
                     # Sort by count descending for readability
                     sorted_inv = sorted(inventory.items(), key=lambda x: -x[1])
                     items_str = ", ".join(f"{count} {item}" for item, count in sorted_inv)
-                    info += f"\n    Inventory: {items_str}"
+                    info.append(f"\n    Inventory: {items_str}")
                 else:
-                    info += "\n    Inventory: empty"
+                    info.append("\n    Inventory: empty")
                 # What the player is looking at
                 looking_at = p.get("lookingAt", {})
                 if looking_at:
@@ -124,25 +157,25 @@ class EventBuffer:
                     if looking_at.get("entity"):
                         parts.append(looking_at["entity"])
                     if parts:
-                        info += f"\n    Looking at: {', '.join(parts)}"
+                        info.append(f"\n    Looking at: {', '.join(parts)}")
                 # Immediate surroundings (8 blocks)
                 close = p.get("closeEntities", {})
                 if close:
                     sorted_close = sorted(close.items(), key=lambda x: -x[1])
                     close_str = ", ".join(f"{count} {etype}" for etype, count in sorted_close)
-                    info += f"\n    Immediate vicinity (8 blocks): {close_str}"
+                    info.append(f"\n    Immediate vicinity (8 blocks): {close_str}")
                 # Notable blocks nearby (8 blocks)
                 notable = p.get("notableBlocks", {})
                 if notable:
                     sorted_notable = sorted(notable.items(), key=lambda x: -x[1])
                     notable_str = ", ".join(f"{count} {block}" for block, count in sorted_notable)
-                    info += f"\n    Notable blocks nearby (8 blocks): {notable_str}"
+                    info.append(f"\n    Notable blocks nearby (8 blocks): {notable_str}")
                 # Nearby entities (wider area)
                 nearby = p.get("nearbyEntities", {})
                 if nearby:
                     sorted_nearby = sorted(nearby.items(), key=lambda x: -x[1])
                     nearby_str = ", ".join(f"{count} {etype}" for etype, count in sorted_nearby)
-                    info += f"\n    Nearby entities (32 blocks): {nearby_str}"
+                    info.append(f"\n    Nearby entities (32 blocks): {nearby_str}")
                 # Death history
                 if death_memorial:
                     death_context = death_memorial.format_for_summary(
@@ -152,8 +185,8 @@ class EventBuffer:
                         loc.get("z", 0),
                     )
                     if death_context:
-                        info += f"\n{death_context}"
-                lines.append(info)
+                        info.append(f"\n{death_context}")
+                lines.append("".join(info))
             sections.append("PLAYERS ONLINE:\n" + "\n".join(lines))
 
         # Chat messages — verbatim, wrapped in delimiters
@@ -191,7 +224,7 @@ class EventBuffer:
                 killer = k.get("damagingEntity", "unknown")
                 mob = k.get("entity", "unknown")
                 # Strip minecraft: prefix for readability
-                mob = mob.replace("minecraft:", "")
+                mob = mob.removeprefix("minecraft:")
                 kill_counts[killer][mob] += 1
 
             lines = []
@@ -248,7 +281,7 @@ def _summarize_blocks(events: list[dict], header: str) -> str:
 
     for e in events:
         player = e.get("player", "?")
-        block = e.get("block", "unknown").replace("minecraft:", "")
+        block = e.get("block", "unknown").removeprefix("minecraft:")
         by_player[player][block] += 1
         loc = e.get("location", {})
         y = loc.get("y")
@@ -302,8 +335,8 @@ def _summarize_combat(events: list[dict]) -> str:
     lines = []
     for (attacker, target), info in fights.items():
         loc = info["location"]
-        target_clean = target.replace("minecraft:", "")
-        attacker_clean = attacker.replace("minecraft:", "")
+        target_clean = target.removeprefix("minecraft:")
+        attacker_clean = attacker.removeprefix("minecraft:")
         lines.append(
             f"  {attacker_clean} vs {target_clean}: "
             f"{info['hits']} hits, {info['total_damage']:.0f} total damage "
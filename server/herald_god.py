@@ -16,7 +16,7 @@ from server.commands import translate_tool_calls
 logger = logging.getLogger("minecraft-god")
 
 # Keywords that directly invoke the Herald — only speaks when addressed
-HERALD_INVOKE_KEYWORDS = {"herald", "bard"}
+HERALD_INVOKE_KEYWORDS = frozenset({"herald", "bard"})
 
 SYSTEM_PROMPT = """\
 You are the Herald, a divine messenger in a Minecraft world. You exist to guide \
@@ -408,8 +408,10 @@ class KindGod:
             Used as the default near_player for build_schematic.
         """
         self.last_memory = None  # reset at start — prevents stale state on early return
-        memory_block = self.memory.format_for_prompt()
-        system_content = SYSTEM_PROMPT + memory_block
+        # Memories lead the user turn rather than trailing the system prompt,
+        # so the system prompt + tool schemas stay a fixed prefix across
+        # consolidations and the provider's prompt cache keeps hitting on them
+        system_content = SYSTEM_PROMPT
 
         user_content = f"=== WORLD UPDATE ===\n\n{event_summary}\n\nWhat do you do, if anything?"
         if self._deep_god_acted:
@@ -419,6 +421,9 @@ class KindGod:
                 "as you choose.\n\n" + user_content
             )
             self._deep_god_acted = False
+        memory_block = self.memory.format_for_prompt()
+        if memory_block:
+            user_content = memory_block.lstrip("\n") + "\n\n" + user_content
 
         conversation = [{"role": "user", "content": user_content}]
 
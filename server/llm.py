@@ -1,14 +1,22 @@
 import logging
 
 import httpx
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
-from server.config import ZHIPU_API_KEY, LLM_BASE_URL
+from server.config import ZHIPU_API_KEY, LLM_BASE_URL, LLM_KEEPALIVE_EXPIRY
 
 logger = logging.getLogger("minecraft-god")
 
+# One client (and so one connection pool) shared by every god, the herald and
+# memory consolidation.  httpx drops idle connections after 5s by default,
+# which meant a fresh TCP+TLS handshake on every tick — keep them past the
+# tick interval so consecutive ticks reuse one.
 client = AsyncOpenAI(
     api_key=ZHIPU_API_KEY,
     base_url=LLM_BASE_URL,
     timeout=httpx.Timeout(300.0, connect=10.0),  # 5 min total, 10s connect
+    http_client=DefaultAsyncHttpxClient(
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32,
+                            keepalive_expiry=LLM_KEEPALIVE_EXPIRY),
+    ),
 )
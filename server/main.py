@@ -6,19 +6,25 @@ and queues commands for the Paper plugin to execute.
 
 import asyncio
 import collections
+import functools
 import json
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 import logging
 import os
 import random
 import time
 
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
-from pydantic import BaseModel
-
-from server.config import GOD_TICK_INTERVAL, MEMORY_CONSOLIDATION_INTERVAL_SECONDS, CONSOLIDATION_LOG_FILE
-from server.events import EventBuffer
+from fastapi import FastAPI, HTTPException, Request
+
+from server.commands import GOD_CHAT_STYLE, _wrap_message_lines
+from server.config import (
+    CONSOLIDATION_LOG_FILE,
+    GOD_TICK_INTERVAL,
+    KIND_GOD_ACTION_THRESHOLD,
+    MEMORY_CONSOLIDATION_INTERVAL_SECONDS,
+)
+from server.events import EventBuffer, find_player
 from server.kind_god import KindGod
 from server.deep_god import DeepGod
 from server.herald_god import HeraldGod
@@ -38,9 +44,55 @@ logging.getLogger("uvicorn.error").addFilter(
     and "No supported WebSocket" not in record.getMessage()
 )
 
+class _RecentLogs:
+    """Ring buffer of recent god decisions, stored column-wise.
+
+    The fields nearly every entry carries (time, god, action, player) live in
+    parallel deques; anything else (commands, context, error, counts) goes in
+    a per-entry extras dict only when present. Rows are rebuilt as dicts for
+    the /logs endpoint, with absent fields omitted as before.
+    """
+
+    _COLUMNS = ("time", "god", "action", "player")
+    _MISSING = object()
+
+    def __init__(self, maxlen: int):
+        self._columns = {name: collections.deque(maxlen=maxlen) for name in self._COLUMNS}
+        self._extras: collections.deque = collections.deque(maxlen=maxlen)
+
+    def append(self, entry: dict):
+        for name, column in self._columns.items():
+            column.append(entry.get(name, self._MISSING))
+        extras = {k: v for k, v in entry.items() if k not in self._columns}
+        self._extras.append(extras or None)
+
+    def __len__(self) -> int:
+        return len(self._extras)
+
+    def __getitem__(self, index: int) -> dict:
+        row = {name: column[index] for name, column in self._columns.items()
+               if column[index] is not self._MISSING}
+        extras = self._extras[index]
+        if extras:
+            row.update(extras)
+        return row
+
+    def __iter__(self):
+        missing = self._MISSING
+        for *values, extras in zip(*self._columns.values(), self._extras):
+            row = {name: v for name, v in zip(self._COLUMNS, values) if v is not missing}
+            if extras:
+                row.update(extras)
+            yield row
+
+
 # Global state
 event_buffer = EventBuffer()
-command_queue: list[dict] = []
+# Commands waiting for the Paper plugin's next poll. Bounded so a plugin that
+# stops polling can't grow it without limit — the oldest commands drop first.
+# Producers go through _queue_commands, which warns when that happens.
+_COMMAND_QUEUE_MAX = 1000
+command_queue: collections.deque[dict] = collections.deque(maxlen=_COMMAND_QUEUE_MAX)
 kind_god = KindGod()
 deep_god = DeepGod()
 herald_god = HeraldGod()
@@ -50,12 +102,14 @@ prayer_queue = DivineRequestQueue()
 _tick_task: asyncio.Task | None = None
 _prayer_task: asyncio.Task | None = None
 _tick_lock = asyncio.Lock()
+# Wakes _god_tick_loop — set by the interval timer each cycle
+_tick_wakeup = asyncio.Event()
 # Ring buffer of recent god decisions and commands for debugging
-_recent_logs: collections.deque = collections.deque(maxlen=50)
+_recent_logs = _RecentLogs(maxlen=50)
 # Activity log for memory consolidation — human-readable timeline of all god/player activity.
 # Persists to data/consolidation_log.json on shutdown and loads on startup.
-_consolidation_log: list[str] = []
 _CONSOLIDATION_LOG_MAX = 500
+_consolidation_log: collections.deque[str] = collections.deque(maxlen=_CONSOLIDATION_LOG_MAX)
 # Cooldown after failed consolidation to avoid hammering a failing LLM every tick
 _consolidation_cooldown_until: float = 0
 
@@ -83,24 +137,43 @@ def _save_consolidation_log():
     CONSOLIDATION_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
     try:
         tmp_path = CONSOLIDATION_LOG_FILE.with_suffix(".tmp")
-        tmp_path.write_text(json.dumps(_consolidation_log))
+        tmp_path.write_text(json.dumps(list(_consolidation_log)))
         os.replace(tmp_path, CONSOLIDATION_LOG_FILE)
     except OSError:
         logger.exception("Failed to save activity log to disk")
 
 
+_clock_cache: dict[str, tuple[int, str]] = {}
+
+
+def _clock(fmt: str = "%H:%M:%S") -> str:
+    """time.strftime(fmt) for now, reused across calls within the same second."""
+    now = int(time.time())
+    cached = _clock_cache.get(fmt)
+    if cached is None or cached[0] != now:
+        cached = (now, time.strftime(fmt, time.localtime(now)))
+        _clock_cache[fmt] = cached
+    return cached[1]
+
+
 def _log_activity(entry: str):
     """Append a timestamped entry to the consolidation activity log."""
     if len(_consolidation_log) >= _CONSOLIDATION_LOG_MAX:
+        # The deque's maxlen drops the oldest entry on append
         logger.warning(
             f"Consolidation log at capacity ({_CONSOLIDATION_LOG_MAX} entries) "
             "— dropping oldest entry. Consolidation may be failing."
         )
-        _consolidation_log.pop(0)
-    ts = time.strftime("%H:%M")
+    ts = _clock("%H:%M")
     _consolidation_log.append(f"[{ts}] {entry}")
 
 
+def _drop_consolidated(count: int):
+    """Remove the `count` oldest activity log entries once they've been consolidated."""
+    for _ in range(min(count, len(_consolidation_log))):
+        _consolidation_log.popleft()
+
+
 def _summarize_commands(commands: list[dict]) -> str:
     """Produce a short summary of commands for the activity log."""
     parts = []
@@ -129,10 +202,43 @@ def _summarize_commands(commands: list[dict]) -> str:
     return "; ".join(parts) if parts else "silence"
 
 
+def _debug_command_summary(c: dict) -> str:
+    """One short line describing a command, for the /logs debug ring buffer."""
+    cmd_type = c.get("type")
+    if cmd_type is None:
+        return c.get("command", "?")[:80]
+    if cmd_type == "build_schematic":
+        return f"build_schematic({c.get('blueprint_id')} @ {c.get('x')},{c.get('y')},{c.get('z')})"
+    if cmd_type.startswith("dig_"):
+        return f"{cmd_type}(near {c.get('near_player', '?')})"
+    return c.get("command", "?")[:80]
+
+
+def _debug_command_summaries(commands: list[dict]) -> list[str]:
+    return [_debug_command_summary(c) for c in commands]
+
+
+def _append_commands_log(entry: dict, commands: list[dict] | None = None):
+    """Attach command summaries (if any) to a /logs entry and append it to the ring buffer."""
+    if commands is not None:
+        entry["commands"] = _debug_command_summaries(commands)
+    _recent_logs.append(entry)
+
+
+def _log_recent(entry: dict, commands: list[dict] | None = None):
+    """Append a /logs entry once the current tick or divine request yields.
+
+    Every entry goes through loop.call_soon, so the debug-only command
+    summarization stays out of the _tick_lock critical section and entries
+    land in the order they were logged (call_soon is FIFO).
+    """
+    asyncio.get_running_loop().call_soon(_append_commands_log, entry, commands)
+
+
 # --- In-game feedback messages ---
 
 # Deep God prayer interception — thematic flavor text
-_INTERCEPT_GENERIC = [
+_INTERCEPT_GENERIC = (
     "Your prayer sinks into the stone. Something else hears it.",
     "The words do not rise. They fall.",
     "A deeper voice answers.",
@@ -142,62 +248,62 @@ _INTERCEPT_GENERIC = [
     "The silence after your prayer is not empty.",
     "Your words dissolve into pressure and dark.",
     "The prayer lands, but not where you sent it.",
-]
+)
 
-_INTERCEPT_DEEP = [
+_INTERCEPT_DEEP = (
     "You pray from the deep places. The deep places answer.",
     "At this depth, prayers do not rise. They are absorbed.",
     "The stone around you hums. Your prayer was received.",
     "Something beneath the bedrock acknowledges you.",
-]
+)
 
-_INTERCEPT_NETHER = [
+_INTERCEPT_NETHER = (
     "Prayers do not travel here. But something listened.",
     "In this place, the Kind God cannot reach you.",
     "Your words burn before they reach the sky.",
     "The Nether swallows your prayer whole. Something spits back.",
-]
+)
 
-_INTERCEPT_THRESHOLD = [
+_INTERCEPT_THRESHOLD = (
     "The boundary thins. Another presence answers.",
     "The Kind God has spoken too much. The balance shifts.",
     "Too many kindnesses. The deep corrects.",
     "The weight of mercy tips the scales. Something else rises.",
-]
+)
 
 
 # Silence feedback — when a god hears a prayer but chooses not to act
-_SILENCE_KIND = [
+_SILENCE_KIND = (
     "The Kind God hears your prayer, but offers only silence.",
     "A warm light flickers... and fades. Your prayer goes unanswered.",
     "The Kind God watches, but does not speak.",
     "Your words are heard. No answer comes.",
     "The Kind God considers... and is still.",
-]
+)
 
-_SILENCE_DEEP = [
+_SILENCE_DEEP = (
     "The deep considers your words. It is unimpressed.",
     "The stone does not care about your request.",
     "Your prayer falls into the dark. Nothing stirs.",
     "The deep hears. The deep does not respond.",
     "Silence from below. Your words were noted. Nothing more.",
-]
+)
 
-_SILENCE_HERALD = [
+_SILENCE_HERALD = (
     "The Herald opens their mouth... and closes it. No verse today.",
     "The Herald listens, but finds no words worth singing.",
     "A half-formed verse drifts away on the wind.",
     "The Herald considers your tale, and deems it not yet ready for song.",
     "Silence from the Herald. Not every moment deserves a verse.",
-]
+)
 
-_SILENCE_DIG = [
+_SILENCE_DIG = (
     "The God of Digging peers at your request... and puts down the shovel. Not today.",
     "A distant rumbling. Then nothing. The earth remains unbroken.",
     "The God of Digging considers your words, but finds no hole worth digging.",
     "Silence from below. Even the God of Digging has standards.",
     "The God of Digging yawns. Your request lacks... depth.",
-]
+)
 
 _SILENCE_POOLS = {
     "kind": _SILENCE_KIND,
@@ -207,36 +313,77 @@ _SILENCE_POOLS = {
 }
 
 
+class _ShuffleBag:
+    """Deals messages from a pool in shuffled order, reshuffling once exhausted.
+
+    Each message appears once per pass, and a new pass never opens with the
+    message that closed the previous one, so players don't see repeats back
+    to back.
+    """
+
+    def __init__(self, pool: tuple[str, ...]):
+        self._pool = pool
+        self._remaining: list[str] = []
+        self._last: str | None = None
+
+    def draw(self) -> str:
+        if not self._remaining:
+            # Drawn from the end, so [-1] is the first message of the pass
+            self._remaining = random.sample(self._pool, len(self._pool))
+            if len(self._remaining) > 1 and self._remaining[-1] == self._last:
+                self._remaining[0], self._remaining[-1] = self._remaining[-1], self._remaining[0]
+        self._last = self._remaining.pop()
+        return self._last
+
+
+_INTERCEPT_GENERIC_BAG = _ShuffleBag(_INTERCEPT_GENERIC)
+_INTERCEPT_DEEP_BAG = _ShuffleBag(_INTERCEPT_DEEP)
+_INTERCEPT_NETHER_BAG = _ShuffleBag(_INTERCEPT_NETHER)
+_INTERCEPT_THRESHOLD_BAG = _ShuffleBag(_INTERCEPT_THRESHOLD)
+
+
 def _pick_intercept_message(player_status: dict | None, praying_player: str | None,
                             kind_god_action_count: int) -> str:
     """Pick a context-appropriate interception message."""
-    from server.config import KIND_GOD_ACTION_THRESHOLD
-
     # Check if this was a forced threshold trigger
     if kind_god_action_count >= KIND_GOD_ACTION_THRESHOLD:
-        return random.choice(_INTERCEPT_THRESHOLD)
+        return _INTERCEPT_THRESHOLD_BAG.draw()
 
     # Check praying player's location for context
-    if player_status and player_status.get("players") and praying_player:
-        for p in player_status["players"]:
-            if p.get("name", "").lower() != praying_player.lower():
-                continue
-            dim = p.get("dimension", "")
-            y = p.get("location", {}).get("y", 64)
+    p = find_player(player_status, praying_player) if praying_player else None
+    if p:
+        dim = p.get("dimension", "")
+        y = p.get("location", {}).get("y", 64)
+
+        if "nether" in dim.lower():
+            return _INTERCEPT_NETHER_BAG.draw()
+        if y < 0:
+            return _INTERCEPT_DEEP_BAG.draw()
+
+    return _INTERCEPT_GENERIC_BAG.draw()
 
-            if "nether" in dim.lower():
-                return random.choice(_INTERCEPT_NETHER)
-            if y < 0:
-                return random.choice(_INTERCEPT_DEEP)
 
-    return random.choice(_INTERCEPT_GENERIC)
+@functools.lru_cache(maxsize=256)
+def _tellraw_json(message: str, color: str, italic: bool) -> str:
+    """Serialized tellraw text component — cached, since narrator messages come from fixed pools."""
+    return json.dumps([{"text": message, "color": color, "italic": italic}])
+
+
+def _queue_commands(commands: list[dict]):
+    """Queue commands for the plugin's next poll, warning if any push out older ones."""
+    overflow = len(command_queue) + len(commands) - _COMMAND_QUEUE_MAX
+    if overflow > 0:
+        logger.warning(
+            f"Command queue full ({_COMMAND_QUEUE_MAX}) — dropping the {overflow} oldest "
+            f"commands; is the plugin polling /commands?"
+        )
+    command_queue.extend(commands)
 
 
 def _make_tellraw(message: str, target: str = "@a",
                   color: str = "dark_purple", italic: bool = True) -> dict:
     """Create a tellraw command dict for system/narrator messages."""
-    text_json = json.dumps([{"text": message, "color": color, "italic": italic}])
-    return {"command": f"tellraw {target} {text_json}"}
+    return {"command": f"tellraw {target} {_tellraw_json(message, color, italic)}"}
 
 
 # Mapping from acting_god key to GOD_CHAT_STYLE key
@@ -295,7 +442,6 @@ def _make_thinking_callback(god_key: str) -> Callable[[str], None]:
     to the command queue, so players see thinking in real-time (especially
     useful for Kind God's multi-turn deliberation).
     """
-    from server.commands import GOD_CHAT_STYLE, _wrap_message_lines
     style_key = _GOD_STYLE_KEY.get(god_key)
     style = GOD_CHAT_STYLE.get(style_key, {"name": god_key, "color": "gray"})
     god_name = style["name"]
@@ -308,25 +454,30 @@ def _make_thinking_callback(god_key: str) -> Callable[[str], None]:
         # Header: "The Kind God thinks:" in bold
         header = json.dumps([{"text": f"{god_name} thinks:", "color": color,
                               "bold": True, "italic": True}])
-        command_queue.append({"command": f"tellraw @a {header}"})
+        _queue_commands([{"command": f"tellraw @a {header}"}])
         # Each line as a separate tellraw, word-wrapped for chat width
         for line in lines:
             for wrapped in _wrap_message_lines(line):
                 line_json = json.dumps([{"text": f"  {wrapped}", "color": color, "italic": True}])
-                command_queue.append({"command": f"tellraw @a {line_json}"})
+                _queue_commands([{"command": f"tellraw @a {line_json}"}])
 
     return on_thinking
 
 
+_GOD_FAILURE_MESSAGES = {
+    "kind": "The Kind God stirs, but cannot speak. Something is wrong.",
+    "deep": "The deep rumbles, but forms no words. An error in the stone.",
+    "herald": "The Herald opens their mouth, but silence falls. The verse is lost.",
+    "dig": "The God of Digging raises a shovel... and drops it. Something went wrong.",
+}
+
+_PRAYER_ABANDONED_MESSAGE = "Your prayer dissolves into silence. The gods cannot reach you now."
+_PRAYER_QUEUE_FULL_MESSAGE = "Too many voices cry out at once. The gods cannot hear you — pray again later."
+
+
 def _god_failure_commands(god_name: str, target: str = "@a") -> list[dict]:
     """Generate in-game feedback commands when a god's LLM call fails."""
-    messages = {
-        "kind": "The Kind God stirs, but cannot speak. Something is wrong.",
-        "deep": "The deep rumbles, but forms no words. An error in the stone.",
-        "herald": "The Herald opens their mouth, but silence falls. The verse is lost.",
-        "dig": "The God of Digging raises a shovel... and drops it. Something went wrong.",
-    }
-    msg = messages.get(god_name, f"A divine presence falters. ({god_name} error)")
+    msg = _GOD_FAILURE_MESSAGES.get(god_name, f"A divine presence falters. ({god_name} error)")
     return [
         _make_tellraw(msg, target=target, color="red", italic=True),
         {"command": f"playsound minecraft:entity.elder_guardian.curse master {target}"},
@@ -336,14 +487,20 @@ def _god_failure_commands(god_name: str, target: str = "@a") -> list[dict]:
 def _prayer_abandoned_commands(player: str) -> list[dict]:
     """Generate in-game feedback when a prayer is abandoned after max retries."""
     return [
-        _make_tellraw(
-            "Your prayer dissolves into silence. The gods cannot reach you now.",
-            target=player, color="gray", italic=True,
-        ),
+        _make_tellraw(_PRAYER_ABANDONED_MESSAGE, target=player, color="gray", italic=True),
         {"command": f"playsound minecraft:block.amethyst_block.resonate master {player}"},
     ]
 
 
+def _enqueue_divine_request(request: DivineRequest):
+    """Queue a divine request, telling the player if the queue has no room for it."""
+    try:
+        prayer_queue.enqueue(request)
+    except asyncio.QueueFull:
+        _queue_commands([_make_tellraw(_PRAYER_QUEUE_FULL_MESSAGE, target=request.player,
+                                       color="gray", italic=True)])
+
+
 def _build_player_context(player_status: dict | None, prayer_snapshot: dict | None = None) -> dict:
     """Build a player_context dict mapping lowercase player names to position/facing data.
 
@@ -377,12 +534,6 @@ def _build_player_context(player_status: dict | None, prayer_snapshot: dict | No
     return ctx
 
 
-class GameEvent(BaseModel):
-    type: str
-    # All other fields are dynamic, so we accept anything
-    model_config = {"extra": "allow"}
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Start the god tick loop and prayer loop on startup, cancel on shutdown."""
@@ -400,31 +551,61 @@ async def lifespan(app: FastAPI):
                 await task
             except asyncio.CancelledError:
                 pass
-    # Flush state to disk on shutdown
-    kind_god.memory._save()
-    dig_god.memory._save()
-    _save_consolidation_log()
+    # Flush state to disk on shutdown — in worker threads so the loop can
+    # keep draining in-flight requests during graceful shutdown
+    await asyncio.gather(
+        asyncio.to_thread(kind_god.memory._save),
+        asyncio.to_thread(dig_god.memory._save),
+        asyncio.to_thread(_save_consolidation_log),
+    )
     logger.info("God memories and activity log saved")
 
 
 app = FastAPI(title="minecraft-god", lifespan=lifespan)
 
 
-@app.post("/event")
-async def receive_event(event: GameEvent):
-    """Receive a game event from the Paper plugin."""
-    event_data = event.model_dump()
+# /event reads the raw body (see receive_event), so describe it for the
+# OpenAPI docs by hand — the plugin's events share only the "type" field
+_EVENT_BODY_SCHEMA = {
+    "type": "object",
+    "required": ["type"],
+    "properties": {"type": {"type": "string"}},
+    "additionalProperties": True,
+}
+
+
+@app.post("/event", openapi_extra={
+    "requestBody": {"required": True,
+                    "content": {"application/json": {"schema": _EVENT_BODY_SCHEMA}}},
+})
+async def receive_event(request: Request):
+    """Receive a game event from the Paper plugin.
+
+    Events are free-form dicts with a required "type" field; the body is
+    parsed straight into a dict rather than through a pydantic model, since
+    everything downstream reads it with .get().
+    """
+    try:
+        event_data = await request.json()
+    except ValueError:
+        raise HTTPException(status_code=422, detail="Event body is not valid JSON")
+    if not isinstance(event_data, dict) or not isinstance(event_data.get("type"), str):
+        raise HTTPException(status_code=422, detail="Event must be an object with a string 'type'")
     event_buffer.add(event_data)
 
-    # Log non-status events (status beacon fires every ~30s, too noisy)
-    event_type = event_data.get("type", "?")
-    if event_type != "player_status":
-        logger.info(f"[event] {event_type}" + (
-            f" from {event_data.get('player', '?')}" if event_data.get("player") else ""))
+    # Status beacons fire every ~30s and only refresh the cached status —
+    # nothing to log or record
+    event_type = event_data["type"]
+    if event_type == "player_status":
+        return {"status": "ok"}
+
+    logger.info(f"[event] {event_type}" + (
+        f" from {event_data.get('player', '?')}" if event_data.get("player") else ""))
 
     # Record player deaths persistently + activity log
-    if event_data.get("type") == "entity_die" and event_data.get("isPlayer"):
-        death_memorial.record_death(event_data)
+    if event_type == "entity_die" and event_data.get("isPlayer"):
+        # Disk write happens in a worker thread so /event isn't blocked on I/O
+        await asyncio.to_thread(death_memorial.record_death, event_data)
         player_name = event_data.get("playerName", "?")
         cause = event_data.get("cause", "unknown")
         killer = event_data.get("damagingEntity", "")
@@ -436,13 +617,13 @@ async def receive_event(event: GameEvent):
         _log_activity(f"DEATH: {death_desc}")
 
     # Player joins/leaves
-    if event_data.get("type") in ("player_join", "player_initial_spawn"):
+    elif event_type in ("player_join", "player_initial_spawn"):
         _log_activity(f"JOIN: {event_data.get('player', '?')} joined the world")
-    if event_data.get("type") == "player_leave":
+    elif event_type == "player_leave":
         _log_activity(f"LEAVE: {event_data.get('player', '?')} left the world")
 
     # Check chat for prayer, herald, or remember keywords
-    if event_data.get("type") == "chat":
+    elif event_type == "chat":
         player_name = event_data.get("player", event_data.get("sender", "?"))
         message = event_data.get("message", "")
         request_type = classify_divine_request(message)
@@ -470,7 +651,7 @@ async def receive_event(event: GameEvent):
                 player_snapshot=player_snapshot,
                 recent_chat=recent_chat,
             )
-            prayer_queue.enqueue(request)
+            _enqueue_divine_request(request)
         else:
             # Regular chat — log for consolidation context
             _log_activity(f'CHAT: {player_name}: "{message}"')
@@ -479,29 +660,33 @@ async def receive_event(event: GameEvent):
 
 
 @app.get("/commands")
-async def get_commands():
+async def get_commands() -> list[dict]:
     """Return pending commands for the Paper plugin to execute, then clear the queue.
 
     Uses atomic swap to prevent duplicate delivery — even if two clients
-    poll simultaneously, only one will receive the commands.
+    poll simultaneously, only one will receive the commands.  This is the
+    only place the global is rebound; producers append through the module
+    name at call time, so nothing is left holding the drained deque.
     """
     global command_queue
+    # Most polls find nothing queued — skip the swap and reallocation
+    if not command_queue:
+        return []
     commands = command_queue
-    command_queue = []
-    return commands
+    command_queue = collections.deque(maxlen=_COMMAND_QUEUE_MAX)
+    return list(commands)
 
 
 @app.post("/commands")
 async def inject_commands(commands: list[dict]):
     """Inject commands directly into the queue (for testing/admin use)."""
-    global command_queue
-    command_queue.extend(commands)
+    _queue_commands(commands)
     logger.info(f"Injected {len(commands)} commands via POST /commands")
     return {"status": "ok", "queued": len(commands)}
 
 
 @app.get("/status")
-async def get_status():
+async def get_status() -> dict:
     """Debug endpoint showing current state."""
     secs_since = kind_god.memory.seconds_since_consolidation()
     return {
@@ -516,36 +701,88 @@ async def get_status():
         "dig_god_memory_count": len(dig_god.memory.records),
         "dig_god_action_count": dig_god.action_count,
         "player_status": event_buffer.get_player_status(),
-        "death_records": {p: len(d) for p, d in death_memorial.deaths.items()},
+        "death_records": death_memorial.death_counts(),
     }
 
 
 @app.get("/logs")
-async def get_logs():
+async def get_logs() -> list[dict]:
     """Recent god decisions and commands — ring buffer of last 50 ticks."""
     return list(_recent_logs)
 
 
+_GOD_LABELS = {"kind": "Kind God", "deep": "Deep God", "herald": "Herald",
+               "dig": "God of Digging"}
+
+
+def _start_primary_god(event_summary: str, player_status: dict | None,
+                       player_context: dict, tag: str,
+                       praying_player: str | None = None) -> tuple[str, Awaitable]:
+    """Pick the Kind or Deep God for this context and start its think() call.
+
+    Returns (acting_god, awaitable) so the caller can await the call alone or
+    alongside the Herald.  On prayers the Deep God's interception message is
+    queued before it thinks.
+    """
+    if deep_god.should_act(event_summary, player_status, kind_god.action_count,
+                           praying_player=praying_player):
+        logger.info(f"[{tag}] === THE DEEP GOD STIRS ===")
+        if praying_player:
+            intercept_msg = _pick_intercept_message(
+                player_status, praying_player, kind_god.action_count)
+            _queue_commands([_make_tellraw(intercept_msg, target=praying_player)])
+            logger.info(f"[{tag}] Interception message to {praying_player}: {intercept_msg}")
+        return "deep", deep_god.think(event_summary,
+                                      on_thinking=_make_thinking_callback("deep"))
+
+    return "kind", kind_god.think(event_summary, player_context=player_context,
+                                  requesting_player=praying_player,
+                                  on_thinking=_make_thinking_callback("kind"))
+
+
+def _finish_primary_god(acting_god: str):
+    """Bookkeeping once the Kind or Deep God has had its turn."""
+    if acting_god == "deep":
+        kind_god.notify_deep_god_acted()
+        kind_god.reset_action_count()
+    elif kind_god.last_memory:
+        _log_activity(f"Kind God reflects: {kind_god.last_memory}")
+
+
+def _god_error_entry(tick_ts: str, acting_god: str, action: str,
+                     exc: BaseException | None = None) -> dict:
+    """/logs entry for a god whose think() returned None or raised exc."""
+    if exc is not None:
+        error = f"{type(exc).__name__}: {exc}"
+    else:
+        error = (kind_god if acting_god == "kind" else deep_god).last_error
+    return {"time": tick_ts, "god": acting_god, "action": action, "error": error}
+
+
 async def _prayer_loop():
     """Background loop that processes divine requests (prayers, herald, dig, remember) from the queue.
 
     Acquires _tick_lock to prevent concurrent god think() calls with the
     timer tick — shared state (command_queue, action counts) is not safe for
-    concurrent access.
+    concurrent access.  The lock is taken before the request is dequeued, so
+    a prayer that arrives during a long tick stays on the queue (visible in
+    /status, and ordered behind any requeued retries) rather than being held
+    in flight.
     """
     logger.info("Divine request processing loop started")
     while True:
         try:
-            request = await prayer_queue.dequeue()
-            logger.info(
-                f"[{request.request_type}] Dequeued from {request.player}: "
-                f"\"{request.message[:60]}\" "
-                f"(attempt {request.attempts + 1}/{MAX_ATTEMPTS}, "
-                f"queue remaining: {prayer_queue.size})"
-            )
+            await prayer_queue.wait_for_request()
 
             # Acquire the tick lock — requests and timer ticks must not overlap
             async with _tick_lock:
+                request = prayer_queue.dequeue_nowait()
+                logger.info(
+                    f"[{request.request_type}] Dequeued from {request.player}: "
+                    f"\"{request.message[:60]}\" "
+                    f"(attempt {request.attempts + 1}/{MAX_ATTEMPTS}, "
+                    f"queue remaining: {prayer_queue.size})"
+                )
                 await _process_divine_request(request)
 
         except asyncio.CancelledError:
@@ -557,98 +794,99 @@ async def _prayer_loop():
             )
             if request.request_type == "remember":
                 # Remember failures are handled internally; don't retry
-                command_queue.append(
+                _queue_commands([
                     _make_tellraw(
                         "The Kind God's reflection falters. Something went wrong.",
                         target=request.player, color="red", italic=True,
                     )
-                )
+                ])
             else:
                 # Requeue so the player isn't silently ignored
                 try:
                     if not prayer_queue.requeue(request):
-                        command_queue.extend(_prayer_abandoned_commands(request.player))
+                        _queue_commands(_prayer_abandoned_commands(request.player))
                 except Exception:
                     logger.exception("Failed to requeue after processing error")
-                    command_queue.extend(_prayer_abandoned_commands(request.player))
+                    _queue_commands(_prayer_abandoned_commands(request.player))
 
 
 async def _process_divine_request(request: DivineRequest):
     """Process a single divine request (prayer, herald, dig, or remember) under _tick_lock."""
-    global command_queue, _consolidation_cooldown_until
+    global _consolidation_cooldown_until
 
-    tick_ts = time.strftime("%H:%M:%S")
+    tick_ts = _clock()
     rt = request.request_type
 
     if rt == "remember":
         # Memory consolidation — check preconditions, then attempt consolidation
         if not _consolidation_log:
             logger.info(f"[remember] {request.player} requested consolidation but activity log is empty")
-            command_queue.append(
+            _queue_commands([
                 _make_tellraw(
                     "The Kind God has nothing new to reflect upon.",
                     target=request.player, color="gray", italic=True,
                 )
-            )
-            _recent_logs.append({"time": tick_ts, "action": "remember_empty",
-                                 "player": request.player})
+            ])
+            _log_recent({"time": tick_ts, "action": "remember_empty",
+                         "player": request.player})
             return
 
         now = time.time()
         if now < _consolidation_cooldown_until:
             logger.info(f"[remember] {request.player} requested consolidation but still in cooldown")
-            command_queue.append(
+            _queue_commands([
                 _make_tellraw(
                     "The Kind God is still recovering from a troubled reflection. Try again later.",
                     target=request.player, color="gray", italic=True,
                 )
-            )
-            _recent_logs.append({"time": tick_ts, "action": "remember_cooldown",
-                                 "player": request.player})
+            ])
+            _log_recent({"time": tick_ts, "action": "remember_cooldown",
+                         "player": request.player})
             return
 
         # Preconditions met — send feedback and run consolidation
-        command_queue.append(
+        _queue_commands([
             _make_tellraw(
                 "The Kind God closes its eyes and reflects on all that has passed...",
                 target=request.player, color="gold", italic=True,
             )
-        )
-        command_queue.append(
+        ])
+        _queue_commands([
             {"command": f"playsound minecraft:block.amethyst_block.chime master {request.player}"}
-        )
+        ])
 
         snapshot_len = len(_consolidation_log)
         logger.info(
             f"=== KIND GOD MEMORY CONSOLIDATION "
             f"(triggered by {request.player}, {snapshot_len} entries) ==="
         )
-        activity_snapshot = _consolidation_log.copy()
+        activity_snapshot = list(_consolidation_log)
         try:
             await kind_god.memory.consolidate(activity_snapshot)
-            del _consolidation_log[:snapshot_len]
+            _drop_consolidated(snapshot_len)
             _save_consolidation_log()
-            _recent_logs.append({"time": tick_ts, "action": "remember_consolidation",
-                                 "entries_processed": len(activity_snapshot),
-                                 "memories": len(kind_god.memory.memories),
-                                 "player": request.player})
+            _log_recent({"time": tick_ts, "action": "remember_consolidation",
+                         "entries_processed": len(activity_snapshot),
+                         "memories": len(kind_god.memory.memories),
+                         "player": request.player})
             _log_activity(f"Kind God consolidated memories (requested by {request.player})")
         except Exception as exc:
             logger.exception(f"Memory consolidation failed (requested by {request.player})")
             _consolidation_cooldown_until = now + MEMORY_CONSOLIDATION_INTERVAL_SECONDS
             _save_consolidation_log()
-            _recent_logs.append({"time": tick_ts, "action": "remember_error",
-                                 "error": f"{type(exc).__name__}: {exc}",
-                                 "player": request.player})
-            command_queue.append(
+            _log_recent({"time": tick_ts, "action": "remember_error",
+                         "error": f"{type(exc).__name__}: {exc}",
+                         "player": request.player})
+            _queue_commands([
                 _make_tellraw(
                     "The Kind God's reflection shatters. The memories slip away... try again later.",
                     target=request.player, color="red", italic=True,
                 )
-            )
+            ])
         return
 
     event_summary = request.build_context()
+    herald_acts = False  # set on prayers the Herald also answers
     player_status = event_buffer.get_player_status()
     player_context = _build_player_context(player_status, request.player_snapshot)
 
@@ -663,10 +901,10 @@ async def _process_divine_request(request: DivineRequest):
                                          on_thinking=_make_thinking_callback("herald"))
 
         if commands is None:
-            _recent_logs.append({"time": tick_ts, "god": "herald", "action": "herald_error",
-                                 "error": herald_god.last_error, "player": request.player})
+            _log_recent({"time": tick_ts, "god": "herald", "action": "herald_error",
+                         "error": herald_god.last_error, "player": request.player})
             if not prayer_queue.requeue(request):
-                command_queue.extend(_prayer_abandoned_commands(request.player))
+                _queue_commands(_prayer_abandoned_commands(request.player))
             logger.warning(f"[herald] Herald failed for {request.player} "
                            f"(attempt {request.attempts}/{MAX_ATTEMPTS})")
             return
@@ -679,10 +917,10 @@ async def _process_divine_request(request: DivineRequest):
                                        on_thinking=_make_thinking_callback("dig"))
 
         if commands is None:
-            _recent_logs.append({"time": tick_ts, "god": "dig", "action": "dig_error",
-                                 "error": dig_god.last_error, "player": request.player})
+            _log_recent({"time": tick_ts, "god": "dig", "action": "dig_error",
+                         "error": dig_god.last_error, "player": request.player})
             if not prayer_queue.requeue(request):
-                command_queue.extend(_prayer_abandoned_commands(request.player))
+                _queue_commands(_prayer_abandoned_commands(request.player))
             logger.warning(f"[dig] Dig God failed for {request.player} "
                            f"(attempt {request.attempts}/{MAX_ATTEMPTS})")
             return
@@ -696,15 +934,14 @@ async def _process_divine_request(request: DivineRequest):
                 synth_msg = sentinel.get("message", request.message)
                 logger.info(f"[dig] Dig God redirecting to Kind God on behalf of {original_player}: {synth_msg}")
                 # Show the inter-god handoff in chat so players can see it
-                from server.commands import _wrap_message_lines
                 forward_header = json.dumps([
                     {"text": "The God of Digging ", "color": "dark_aqua", "bold": True},
                     {"text": "forwards to The Kind God:", "color": "dark_aqua", "italic": True},
                 ])
-                command_queue.append({"command": f"tellraw @a {forward_header}"})
+                _queue_commands([{"command": f"tellraw @a {forward_header}"}])
                 for fwd_line in _wrap_message_lines(synth_msg):
                     fwd_json = json.dumps([{"text": f"  {fwd_line}", "color": "gray", "italic": True}])
-                    command_queue.append({"command": f"tellraw @a {fwd_json}"})
+                    _queue_commands([{"command": f"tellraw @a {fwd_json}"}])
                 # The prayer arrives at Kind God as sent by the dig god,
                 # but player field stays as the original player so Kind God
                 # targets them with effects/responses. The chat history shows
@@ -721,99 +958,95 @@ async def _process_divine_request(request: DivineRequest):
                     player_snapshot=request.player_snapshot,
                     recent_chat=dig_god_chat,
                 )
-                prayer_queue.enqueue(synth_request)
+                _enqueue_divine_request(synth_request)
     else:
         # Prayers route through Deep God trigger logic
-        acting_god = "kind"
-        intercept_target = request.player
+        acting_god, main_think = _start_primary_god(
+            event_summary, player_status, player_context, "prayer",
+            praying_player=request.player)
+
+        # Herald can also respond to prayers independently (but not to herald
+        # invocations — that would double-trigger). Its LLM call overlaps the
+        # main god's rather than waiting for it. Only on the first attempt:
+        # its reply is queued even when the main god fails, so a retry would
+        # make it answer the same prayer again.
+        herald_acts = request.attempts == 0 and herald_god.should_act(event_summary)
+        if herald_acts:
+            logger.info("[prayer] === THE HERALD ALSO SPEAKS ===")
+            commands, herald_commands = await asyncio.gather(
+                main_think,
+                herald_god.think(event_summary, on_thinking=_make_thinking_callback("herald")),
+                return_exceptions=True,
+            )
+            if isinstance(herald_commands, BaseException):
+                logger.error("[prayer] Herald think() raised", exc_info=herald_commands)
+                herald_commands = None
+            # Let the prayer loop's handler requeue, as if awaited alone
+            if isinstance(commands, BaseException):
+                _queue_prayer_herald_reply(request.player, herald_commands)
+                raise commands
+        else:
+            commands = await main_think
 
-        if deep_god.should_act(event_summary, player_status, kind_god.action_count,
-                               praying_player=request.player):
-            acting_god = "deep"
-            logger.info("[prayer] === THE DEEP GOD STIRS ===")
+        if commands is None:
+            if herald_acts:
+                _queue_prayer_herald_reply(request.player, herald_commands)
+            _log_recent({**_god_error_entry(tick_ts, acting_god, "prayer_error"),
+                         "player": request.player})
+            if not prayer_queue.requeue(request):
+                _queue_commands(_prayer_abandoned_commands(request.player))
+            logger.warning(f"[prayer] {_GOD_LABELS[acting_god]} failed for {request.player} "
+                           f"(attempt {request.attempts}/{MAX_ATTEMPTS})")
+            return
 
-            intercept_msg = _pick_intercept_message(
-                player_status, request.player, kind_god.action_count)
-            command_queue.append(_make_tellraw(intercept_msg, target=intercept_target))
-            logger.info(f"[prayer] Interception message to {intercept_target}: {intercept_msg}")
-
-            commands = await deep_god.think(event_summary,
-                                           on_thinking=_make_thinking_callback("deep"))
-
-            if commands is None:
-                _recent_logs.append({"time": tick_ts, "god": "deep", "action": "prayer_error",
-                                     "error": deep_god.last_error, "player": request.player})
-                if not prayer_queue.requeue(request):
-                    command_queue.extend(_prayer_abandoned_commands(request.player))
-                logger.warning(f"[prayer] Deep God failed for {request.player} "
-                               f"(attempt {request.attempts}/{MAX_ATTEMPTS})")
-                return
-
-            kind_god.notify_deep_god_acted()
-            kind_god.reset_action_count()
-        else:
-            commands = await kind_god.think(event_summary, player_context=player_context,
-                                           requesting_player=request.player,
-                                           on_thinking=_make_thinking_callback("kind"))
-
-            if commands is None:
-                _recent_logs.append({"time": tick_ts, "god": "kind", "action": "prayer_error",
-                                     "error": kind_god.last_error, "player": request.player})
-                if not prayer_queue.requeue(request):
-                    command_queue.extend(_prayer_abandoned_commands(request.player))
-                logger.warning(f"[prayer] Kind God failed for {request.player} "
-                               f"(attempt {request.attempts}/{MAX_ATTEMPTS})")
-                return
-
-            if kind_god.last_memory:
-                _log_activity(f"Kind God reflects: {kind_god.last_memory}")
+        _finish_primary_god(acting_god)
 
     if commands:
-        command_queue.extend(commands)
-        cmd_summaries = []
-        for c in commands:
-            if c.get("type") == "build_schematic":
-                cmd_summaries.append(f"build_schematic({c.get('blueprint_id')} @ {c.get('x')},{c.get('y')},{c.get('z')})")
-            elif c.get("type", "").startswith("dig_"):
-                cmd_summaries.append(f"{c['type']}(near {c.get('near_player', '?')})")
-            else:
-                cmd_summaries.append(c.get("command", "?")[:80])
+        _queue_commands(commands)
         logger.info(f"[{rt}] Answered {request.player}: {len(commands)} commands queued")
-        _recent_logs.append({"time": tick_ts, "god": acting_god, "action": f"{rt}_answered",
-                             "commands": cmd_summaries, "player": request.player,
-                             "context": event_summary})
+        _log_recent({"time": tick_ts, "god": acting_god, "action": f"{rt}_answered",
+                     "player": request.player, "context": event_summary},
+                    commands)
         # Activity log — record god response
-        god_label = {"kind": "Kind God", "deep": "Deep God", "herald": "Herald",
-                     "dig": "God of Digging"}[acting_god]
-        _log_activity(f"{god_label} answered {request.player}'s {rt}: {_summarize_commands(commands)}")
+        _log_activity(f"{_GOD_LABELS[acting_god]} answered {request.player}'s {rt}: {_summarize_commands(commands)}")
     else:
         logger.info(f"[{rt}] {acting_god} god was silent for {request.player}'s {rt}")
-        _recent_logs.append({"time": tick_ts, "god": acting_god, "action": f"{rt}_silent",
-                             "player": request.player, "context": event_summary})
+        _log_recent({"time": tick_ts, "god": acting_god, "action": f"{rt}_silent",
+                     "player": request.player, "context": event_summary})
         # Send in-game feedback so the player knows their request was heard but unanswered
         if rt in ("prayer", "herald", "dig"):
             silence_pool = _SILENCE_POOLS.get(acting_god, _SILENCE_KIND)
             silence_msg = random.choice(silence_pool)
-            command_queue.append(
+            _queue_commands([
                 _make_tellraw(silence_msg, target=request.player,
                               color="gray", italic=True)
-            )
-            god_label = {"kind": "Kind God", "deep": "Deep God", "herald": "Herald",
-                         "dig": "God of Digging"}[acting_god]
-            _log_activity(f"{god_label} was silent for {request.player}'s {rt}")
-
-    # Herald can also respond to prayers independently (but not to herald invocations —
-    # that would double-trigger)
-    if rt == "prayer" and herald_god.should_act(event_summary):
-        logger.info("[prayer] === THE HERALD ALSO SPEAKS ===")
-        herald_commands = await herald_god.think(event_summary,
-                                                on_thinking=_make_thinking_callback("herald"))
-        if herald_commands is None:
-            command_queue.extend(_god_failure_commands("herald"))
-        elif herald_commands:
-            command_queue.extend(herald_commands)
-            logger.info(f"[prayer] Queued {len(herald_commands)} Herald commands")
-            _log_activity(f"Herald also spoke about {request.player}'s prayer: {_summarize_commands(herald_commands)}")
+            ])
+            _log_activity(f"{_GOD_LABELS[acting_god]} was silent for {request.player}'s {rt}")
+
+    # Herald replies follow the main god's answer in chat
+    if herald_acts:
+        _queue_prayer_herald_reply(request.player, herald_commands)
+
+
+def _queue_prayer_herald_reply(player: str, herald_commands: list[dict] | None):
+    """Queue the Herald's side-reply to a prayer (None means its call failed)."""
+    if herald_commands is None:
+        _queue_commands(_god_failure_commands("herald"))
+    elif herald_commands:
+        _queue_commands(herald_commands)
+        logger.info(f"[prayer] Queued {len(herald_commands)} Herald commands")
+        _log_activity(f"Herald also spoke about {player}'s prayer: {_summarize_commands(herald_commands)}")
+
+
+def _consolidation_due() -> bool:
+    """True when the activity log is non-empty, not in cooldown, and the timer has elapsed."""
+    if not _consolidation_log:
+        return False  # nothing to reflect on
+    if time.time() < _consolidation_cooldown_until:
+        return False  # still in cooldown after a failure
+    if kind_god.memory.seconds_since_consolidation() < MEMORY_CONSOLIDATION_INTERVAL_SECONDS:
+        return False  # not time yet
+    return True
 
 
 async def _maybe_consolidate():
@@ -826,47 +1059,57 @@ async def _maybe_consolidate():
     """
     global _consolidation_cooldown_until
 
-    if not _consolidation_log:
-        return  # nothing to reflect on
+    if not _consolidation_due():
+        return
 
     now = time.time()
-    if now < _consolidation_cooldown_until:
-        return  # still in cooldown after a failure
-    if kind_god.memory.seconds_since_consolidation() < MEMORY_CONSOLIDATION_INTERVAL_SECONDS:
-        return  # not time yet
-
     snapshot_len = len(_consolidation_log)
     logger.info(f"=== KIND GOD MEMORY CONSOLIDATION ({snapshot_len} entries) ===")
-    activity_snapshot = _consolidation_log.copy()
+    activity_snapshot = list(_consolidation_log)
     try:
         await kind_god.memory.consolidate(activity_snapshot)
         # Remove only the entries we snapshot — new entries appended during
         # the LLM call are preserved for the next consolidation
-        del _consolidation_log[:snapshot_len]
+        _drop_consolidated(snapshot_len)
         _save_consolidation_log()
-        _recent_logs.append({"time": time.strftime("%H:%M:%S"),
-                             "action": "consolidation_complete",
-                             "entries_processed": len(activity_snapshot),
-                             "memories": len(kind_god.memory.memories)})
+        _log_recent({"time": _clock(),
+                     "action": "consolidation_complete",
+                     "entries_processed": len(activity_snapshot),
+                     "memories": len(kind_god.memory.memories)})
     except Exception as exc:
         logger.exception("Memory consolidation failed")
         # Cooldown: wait one full interval before retrying
         _consolidation_cooldown_until = now + MEMORY_CONSOLIDATION_INTERVAL_SECONDS
         _save_consolidation_log()
-        _recent_logs.append({"time": time.strftime("%H:%M:%S"),
-                             "action": "consolidation_error",
-                             "error": f"{type(exc).__name__}: {exc}"})
+        _log_recent({"time": _clock(),
+                     "action": "consolidation_error",
+                     "error": f"{type(exc).__name__}: {exc}"})
         # Keep the log — will retry after cooldown
 
 
 async def _god_tick_loop():
-    """Background loop that runs the god tick at regular intervals."""
+    """Background loop that runs the god tick at regular intervals.
+
+    Ticks are scheduled from when the previous one started, not when it
+    finished, so a slow LLM call doesn't push every later tick back.  If a
+    tick overruns the interval, the next one starts as soon as it returns —
+    ticks never overlap.
+    """
     logger.info(f"God tick loop started (interval: {GOD_TICK_INTERVAL}s)")
+    loop = asyncio.get_running_loop()
+    # Timer sets the shared wakeup event; anything else may set it early to
+    # run the next tick without waiting out the interval
+    _tick_wakeup.clear()
+    timer = loop.call_later(GOD_TICK_INTERVAL, _tick_wakeup.set)
     while True:
         try:
-            await asyncio.sleep(GOD_TICK_INTERVAL)
+            await _tick_wakeup.wait()
+            _tick_wakeup.clear()
+            timer.cancel()  # no-op if it fired; drops it if woken early
+            timer = loop.call_later(GOD_TICK_INTERVAL, _tick_wakeup.set)
             await _god_tick()
         except asyncio.CancelledError:
+            timer.cancel()
             break
         except Exception:
             logger.exception("God tick failed")
@@ -874,6 +1117,11 @@ async def _god_tick_loop():
 
 async def _god_tick():
     """Run one cycle of spontaneous divine deliberation (not prayers)."""
+    # Idle tick — nothing buffered and no consolidation pending, so there is
+    # nothing to do under the lock
+    if not event_buffer.has_events() and not _consolidation_due():
+        return
+
     if _tick_lock.locked():
         logger.debug("[tick] Tick skipped — lock held (prayer or previous tick in progress)")
         return
@@ -892,8 +1140,6 @@ async def _god_tick_inner():
     Memory consolidation runs on a wall-clock timer regardless of
     player presence — the Kind God reflects even when alone.
     """
-    global command_queue
-
     # Memory consolidation — wall-clock timer, runs even with no players
     await _maybe_consolidate()
 
@@ -903,11 +1149,11 @@ async def _god_tick_inner():
         discarded = event_buffer.drain_and_summarize(
             death_memorial=death_memorial, filter_divine=True)
         if discarded:
-            tick_ts = time.strftime("%H:%M:%S")
+            tick_ts = _clock()
             logger.info(f"[tick] Skipped — no players online (discarded {len(discarded)} chars of events)")
-            _recent_logs.append({"time": tick_ts, "action": "tick_idle_skip",
-                                 "reason": "no_players_online",
-                                 "discarded_chars": len(discarded)})
+            _log_recent({"time": tick_ts, "action": "tick_idle_skip",
+                         "reason": "no_players_online",
+                         "discarded_chars": len(discarded)})
         return
 
     event_summary = event_buffer.drain_and_summarize(
@@ -917,72 +1163,68 @@ async def _god_tick_inner():
 
     player_context = _build_player_context(player_status)
 
-    tick_ts = time.strftime("%H:%M:%S")
-    acting_god = "kind"
+    tick_ts = _clock()
 
     logger.info(f"[tick] LLM context:\n{event_summary}")
 
-    if deep_god.should_act(event_summary, player_status, kind_god.action_count):
-        acting_god = "deep"
-        logger.info("[tick] === THE DEEP GOD STIRS ===")
+    # The Herald speaks independently — not silenced by either god — so its
+    # LLM call runs concurrently with the Kind/Deep God call
+    herald_acts = herald_god.should_act(event_summary)
 
-        commands = await deep_god.think(event_summary,
-                                       on_thinking=_make_thinking_callback("deep"))
+    acting_god, main_think = _start_primary_god(
+        event_summary, player_status, player_context, "tick")
 
-        if commands is None:
-            command_queue.extend(_god_failure_commands("deep"))
-            _recent_logs.append({"time": tick_ts, "god": "deep", "action": "tick_error",
-                                 "error": deep_god.last_error})
-            commands = []
-
-        kind_god.notify_deep_god_acted()
-        kind_god.reset_action_count()
-    else:
-        commands = await kind_god.think(event_summary, player_context=player_context,
-                                       on_thinking=_make_thinking_callback("kind"))
-
-        if commands is None:
-            command_queue.extend(_god_failure_commands("kind"))
-            _recent_logs.append({"time": tick_ts, "god": "kind", "action": "tick_error",
-                                 "error": kind_god.last_error})
-            commands = []
-
-        if kind_god.last_memory:
-            _log_activity(f"Kind God reflects: {kind_god.last_memory}")
+    # Gathered even when the Herald sits out, so an exception from think()
+    # takes the same failure path either way
+    think_calls = [main_think]
+    if herald_acts:
+        logger.info("[tick] === THE HERALD SPEAKS ===")
+        think_calls.append(
+            herald_god.think(event_summary, on_thinking=_make_thinking_callback("herald")))
+    results = await asyncio.gather(*think_calls, return_exceptions=True)
+    commands = results[0]
+    herald_commands = results[1] if herald_acts else None
+
+    # think() already reports LLM failures as None — treat any escaped
+    # exception the same way so one god's crash doesn't drop the other's output
+    main_exc = herald_exc = None
+    if isinstance(commands, BaseException):
+        logger.error(f"[tick] {acting_god} god think() raised", exc_info=commands)
+        main_exc, commands = commands, None
+    if isinstance(herald_commands, BaseException):
+        logger.error("[tick] Herald think() raised", exc_info=herald_commands)
+        herald_exc, herald_commands = herald_commands, None
+
+    if commands is None:
+        _queue_commands(_god_failure_commands(acting_god))
+        _log_recent(_god_error_entry(tick_ts, acting_god, "tick_error", main_exc))
+        commands = []
+
+    _finish_primary_god(acting_god)
 
     if commands:
-        command_queue.extend(commands)
-        cmd_summaries = []
-        for c in commands:
-            if c.get("type") == "build_schematic":
-                cmd_summaries.append(f"build_schematic({c.get('blueprint_id')} @ {c.get('x')},{c.get('y')},{c.get('z')})")
-            else:
-                cmd_summaries.append(c.get("command", "?")[:80])
+        _queue_commands(commands)
         logger.info(f"[tick] {acting_god} god acted: {len(commands)} commands queued")
-        _recent_logs.append({"time": tick_ts, "god": acting_god, "action": "tick_acted",
-                             "commands": cmd_summaries, "context": event_summary})
+        _log_recent({"time": tick_ts, "god": acting_god, "action": "tick_acted",
+                     "context": event_summary},
+                    commands)
         # Activity log — spontaneous god action
-        god_label = "Kind God" if acting_god == "kind" else "Deep God"
-        _log_activity(f"{god_label} acted spontaneously: {_summarize_commands(commands)}")
+        _log_activity(f"{_GOD_LABELS[acting_god]} acted spontaneously: {_summarize_commands(commands)}")
     else:
         logger.info(f"[tick] {acting_god} god was silent")
-        _recent_logs.append({"time": tick_ts, "god": acting_god, "action": "tick_silent",
-                             "context": event_summary})
-
-    # The Herald speaks independently — not silenced by either god
-    if herald_god.should_act(event_summary):
-        logger.info("[tick] === THE HERALD SPEAKS ===")
-        herald_commands = await herald_god.think(event_summary,
-                                                on_thinking=_make_thinking_callback("herald"))
+        _log_recent({"time": tick_ts, "god": acting_god, "action": "tick_silent",
+                     "context": event_summary})
 
+    if herald_acts:
         if herald_commands is None:
-            command_queue.extend(_god_failure_commands("herald"))
-            _recent_logs.append({"time": tick_ts, "god": "herald", "action": "tick_error",
-                                 "error": herald_god.last_error})
+            _queue_commands(_god_failure_commands("herald"))
+            herald_error = (f"{type(herald_exc).__name__}: {herald_exc}"
+                            if herald_exc is not None else herald_god.last_error)
+            _log_recent({"time": tick_ts, "god": "herald", "action": "tick_error",
+                         "error": herald_error})
         elif herald_commands:
-            command_queue.extend(herald_commands)
+            _queue_commands(herald_commands)
             logger.info(f"[tick] Queued {len(herald_commands)} Herald commands")
-            herald_summaries = [c.get("command", "?")[:80] for c in herald_commands]
-            _recent_logs.append({"time": tick_ts, "god": "herald", "action": "tick_spoke",
-                                 "commands": herald_summaries})
+            _log_recent({"time": tick_ts, "god": "herald", "action": "tick_spoke"},
+                        herald_commands)
             _log_activity(f"Herald spoke spontaneously: {_summarize_commands(herald_commands)}")
@@ -6,10 +6,12 @@ memories of players. The Deep God does not get memory — it does not
 care about individuals.
 """
 
+import asyncio
 import json
 import logging
 import os
 import shutil
+import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -44,6 +46,9 @@ Respond with ONLY a JSON array of memory strings. No other text, no markdown, \
 no code fences. Example:
 ["Steve is a careful builder who stays on the surface.", "Alex prays often."]"""
 
+# Filled once so every consolidation call sends a byte-identical system prompt
+_CONSOLIDATION_SYSTEM_CONTENT = CONSOLIDATION_SYSTEM_PROMPT.format(max_memories=MEMORY_MAX_ENTRIES)
+
 
 class KindGodMemory:
     def __init__(self, memory_path: Path):
@@ -51,6 +56,9 @@ class KindGodMemory:
         self.memories: list[dict] = []
         self.last_consolidation: float = 0  # unix timestamp
         self.consolidation_count: int = 0
+        # Serializes _save — consolidation saves from a worker thread, and a
+        # shutdown save can start before that thread has finished
+        self._save_lock = threading.Lock()
         self._load()
 
     def _load(self) -> None:
@@ -95,17 +103,18 @@ class KindGodMemory:
 
     def _save(self) -> None:
         """Write current memories to disk atomically."""
-        self.memory_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._save_lock:
+            self.memory_path.parent.mkdir(parents=True, exist_ok=True)
 
-        data = {
-            "last_consolidation": self.last_consolidation,
-            "consolidation_count": self.consolidation_count,
-            "memories": self.memories,
-        }
+            data = {
+                "last_consolidation": self.last_consolidation,
+                "consolidation_count": self.consolidation_count,
+                "memories": self.memories,
+            }
 
-        tmp_path = self.memory_path.with_suffix(".tmp")
-        tmp_path.write_text(json.dumps(data, indent=2))
-        os.replace(tmp_path, self.memory_path)
+            tmp_path = self.memory_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data, indent=2))
+            os.replace(tmp_path, self.memory_path)
 
     def seconds_since_consolidation(self) -> float:
         """Wall-clock seconds since last consolidation, or inf if never consolidated."""
@@ -114,7 +123,7 @@ class KindGodMemory:
         return time.time() - self.last_consolidation
 
     def format_for_prompt(self) -> str:
-        """Return memories formatted for injection into the system prompt."""
+        """Return memories formatted for injection into the Kind God's prompt."""
         if not self.memories:
             return ""
 
@@ -159,15 +168,11 @@ class KindGodMemory:
             "Respond with a JSON array of memory strings."
         )
 
-        system_prompt = CONSOLIDATION_SYSTEM_PROMPT.format(
-            max_memories=MEMORY_MAX_ENTRIES
-        )
-
         try:
             response = await client.chat.completions.create(
                 model=GOD_MODEL,
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": _CONSOLIDATION_SYSTEM_CONTENT},
                     {"role": "user", "content": user_message},
                 ],
                 temperature=0.7,
@@ -211,9 +216,12 @@ class KindGodMemory:
 
         new_memories = []
         for s in memory_strings:
-            if not isinstance(s, str) or not s.strip():
+            if not isinstance(s, str):
+                continue
+            content = s.strip()
+            if not content:
                 continue
-            content = s.strip()[:500]  # Truncate overly long entries
+            content = content[:500]  # Truncate overly long entries
             new_memories.append({
                 "created": old_contents.get(content, now),
                 "updated": now,
@@ -223,7 +231,9 @@ class KindGodMemory:
         self.memories = new_memories
         self.last_consolidation = time.time()
         self.consolidation_count += 1
-        self._save()
+        # Disk write in a worker thread so /event and the command poll
+        # aren't stalled behind it
+        await asyncio.to_thread(self._save)
 
         logger.info(
             f"Memory consolidation #{self.consolidation_count}: "
@@ -8,8 +8,11 @@ context even if the player has moved on by the time the request is processed.
 """
 
 import asyncio
+import collections
+import functools
 import logging
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from typing import Literal
 
 from server.config import PRAYER_KEYWORDS, HERALD_KEYWORDS, DIG_KEYWORDS, REMEMBER_KEYWORDS
@@ -17,6 +20,10 @@ from server.config import PRAYER_KEYWORDS, HERALD_KEYWORDS, DIG_KEYWORDS, REMEMB
 logger = logging.getLogger("minecraft-god")
 
 MAX_ATTEMPTS = 5
+# Each queued request is answered by an LLM call, so past this depth the
+# oldest requests would be answered long after anyone cares — and every one
+# holds a full player snapshot
+MAX_QUEUE_DEPTH = 32
 
 # All keywords that trigger divine requests (prayers + herald + dig + remember).
 # All four types go through the DivineRequestQueue — they should be filtered
@@ -24,34 +31,54 @@ MAX_ATTEMPTS = 5
 _ALL_DIVINE_KEYWORDS = PRAYER_KEYWORDS | HERALD_KEYWORDS | DIG_KEYWORDS | REMEMBER_KEYWORDS
 
 
+def _keyword_pattern(keywords: frozenset[str]) -> re.Pattern:
+    """Compile a keyword set into a single case-insensitive substring alternation.
+
+    Matches anywhere in the message (so "godly" contains "god"), same as the
+    plain `kw in message.lower()` scan, but in one pass of the C regex engine.
+    Longer keywords come first so that where one keyword is a prefix of
+    another ("pray"/"prayer"), the match reports the full word.
+    """
+    ordered = sorted(keywords, key=lambda kw: (-len(kw), kw))
+    return re.compile("|".join(re.escape(kw) for kw in ordered), re.IGNORECASE)
+
+
+_ALL_DIVINE_RE = _keyword_pattern(_ALL_DIVINE_KEYWORDS)
+
+# Checked in priority order: remember > dig > prayer > herald
+_CLASSIFY_PATTERNS = (
+    ("remember", _keyword_pattern(REMEMBER_KEYWORDS)),
+    ("dig", _keyword_pattern(DIG_KEYWORDS)),
+    ("prayer", _keyword_pattern(PRAYER_KEYWORDS)),
+    ("herald", _keyword_pattern(HERALD_KEYWORDS)),
+)
+
+
 def is_divine_request(message: str) -> bool:
     """Check if a chat message contains any divine request keywords."""
-    lower = message.lower()
-    return any(kw in lower for kw in _ALL_DIVINE_KEYWORDS)
+    return classify_divine_request(message) is not None
 
 
+# Cached on the raw message: the same chat line is classified at /event, checked
+# again when the tick filters divine requests out of its context, and again for
+# every prayer whose recent-chat window includes it — and players repeat the
+# same invocations ("god help"). is_divine_request shares this cache.
+@functools.lru_cache(maxsize=512)
 def classify_divine_request(message: str) -> str | None:
     """Classify a chat message as "remember", "dig", "prayer", "herald", or None.
 
     Priority: remember > dig > prayer > herald.
     """
-    lower = message.lower()
-    is_remember = any(kw in lower for kw in REMEMBER_KEYWORDS)
-    is_dig = any(kw in lower for kw in DIG_KEYWORDS)
-    is_prayer = any(kw in lower for kw in PRAYER_KEYWORDS)
-    is_herald = any(kw in lower for kw in HERALD_KEYWORDS)
-    if is_remember:
-        return "remember"
-    if is_dig:
-        return "dig"
-    if is_prayer:
-        return "prayer"
-    if is_herald:
-        return "herald"
+    # Most chat is ordinary conversation — one scan rules it out instead of four
+    if _ALL_DIVINE_RE.search(message) is None:
+        return None
+    for request_type, pattern in _CLASSIFY_PATTERNS:
+        if pattern.search(message):
+            return request_type
     return None
 
 
-@dataclass
+@dataclass(slots=True)
 class DivineRequest:
     """A player-initiated request waiting for divine response."""
     player: str
@@ -61,9 +88,17 @@ class DivineRequest:
     player_snapshot: dict          # full player status dict at request time
     recent_chat: list[dict]       # nearby chat messages for context
     attempts: int = 0
+    # The snapshot and chat are frozen at request time, so the context is
+    # built once and reused across retries (up to MAX_ATTEMPTS)
+    _context: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def build_context(self) -> str:
         """Build the LLM context string from the snapshot."""
+        if self._context is None:
+            self._context = self._format_context()
+        return self._context
+
+    def _format_context(self) -> str:
         sections = []
 
         # Player status from snapshot
@@ -74,23 +109,25 @@ class DivineRequest:
             look_v = p.get("lookingVertical", "ahead")
             biome = p.get("biome", "?")
             x, y, z = loc.get('x', '?'), loc.get('y', '?'), loc.get('z', '?')
-            info = (
+            # Built as a list of fragments and joined once, rather than
+            # growing one string with +=
+            info = [
                 f"  - {p['name']}: POSITION: x={x}, y={y}, z={z} "
                 f"in {p.get('dimension', '?')} ({biome}), facing {facing} looking {look_v}, "
                 f"health={p.get('health', '?')}/{p.get('maxHealth', '?')}, "
                 f"food={p.get('foodLevel', '?')}/20, level={p.get('level', '?')}"
-            )
-            armor = [a.replace("minecraft:", "") for a in p.get("armor", []) if a != "minecraft:air"]
-            info += f"\n    Armor: {', '.join(armor)}" if armor else "\n    Armor: none"
+            ]
+            armor = [a.removeprefix("minecraft:") for a in p.get("armor", []) if a != "minecraft:air"]
+            info.append(f"\n    Armor: {', '.join(armor)}" if armor else "\n    Armor: none")
             if p.get("mainHand"):
-                info += f" | Holding: {p['mainHand'].replace('minecraft:', '')}"
+                info.append(f" | Holding: {p['mainHand'].removeprefix('minecraft:')}")
             inventory = p.get("inventory", {})
             if inventory:
                 sorted_inv = sorted(inventory.items(), key=lambda x: -x[1])
                 items_str = ", ".join(f"{count} {item}" for item, count in sorted_inv)
-                info += f"\n    Inventory: {items_str}"
+                info.append(f"\n    Inventory: {items_str}")
             else:
-                info += "\n    Inventory: empty"
+                info.append("\n    Inventory: empty")
             looking_at = p.get("lookingAt", {})
             if looking_at:
                 parts = []
@@ -100,43 +137,44 @@ class DivineRequest:
                 if looking_at.get("entity"):
                     parts.append(looking_at["entity"])
                 if parts:
-                    info += f"\n    Looking at: {', '.join(parts)}"
+                    info.append(f"\n    Looking at: {', '.join(parts)}")
             close = p.get("closeEntities", {})
             if close:
                 sorted_close = sorted(close.items(), key=lambda x: -x[1])
                 close_str = ", ".join(f"{count} {etype}" for etype, count in sorted_close)
-                info += f"\n    Immediate vicinity (8 blocks): {close_str}"
+                info.append(f"\n    Immediate vicinity (8 blocks): {close_str}")
             notable = p.get("notableBlocks", {})
             if notable:
                 sorted_notable = sorted(notable.items(), key=lambda x: -x[1])
                 notable_str = ", ".join(f"{count} {block}" for block, count in sorted_notable)
-                info += f"\n    Notable blocks nearby (8 blocks): {notable_str}"
+                info.append(f"\n    Notable blocks nearby (8 blocks): {notable_str}")
             nearby = p.get("nearbyEntities", {})
             if nearby:
                 sorted_nearby = sorted(nearby.items(), key=lambda x: -x[1])
                 nearby_str = ", ".join(f"{count} {etype}" for etype, count in sorted_nearby)
-                info += f"\n    Nearby entities (32 blocks): {nearby_str}"
+                info.append(f"\n    Nearby entities (32 blocks): {nearby_str}")
 
             label = {
                 "herald": "INVOKING PLAYER",
                 "dig": "REQUESTING PLAYER",
             }.get(self.request_type, "PRAYING PLAYER")
-            sections.append(f"{label}:\n" + info)
+            sections.append(f"{label}:\n" + "".join(info))
 
         # The request itself plus surrounding non-divine chat
         # Filter out other players' prayers/herald invocations so the god only sees this one
         chat_lines = []
+        seen_request = False
         for c in self.recent_chat:
             msg = c.get("message", "")
             sender = c.get("player", "?")
-            is_this_request = (sender == self.player and msg == self.message)
-            is_other_request = (not is_this_request and is_divine_request(msg))
-            if not is_other_request:
-                chat_lines.append(f'  [PLAYER CHAT] {sender}: "{msg}"')
+            if sender == self.player and msg == self.message:
+                seen_request = True
+            elif is_divine_request(msg):
+                continue
+            chat_lines.append(f'  [PLAYER CHAT] {sender}: "{msg}"')
         # Make sure the request itself is included even if it wasn't in recent_chat
-        request_line = f'  [PLAYER CHAT] {self.player}: "{self.message}"'
-        if request_line not in chat_lines:
-            chat_lines.append(request_line)
+        if not seen_request:
+            chat_lines.append(f'  [PLAYER CHAT] {self.player}: "{self.message}"')
         if chat_lines:
             sections.append("CHAT:\n" + "\n".join(chat_lines))
 
@@ -147,24 +185,86 @@ class DivineRequestQueue:
     """FIFO queue of divine requests (prayers + herald + dig + remember)."""
 
     def __init__(self):
-        self._queue: asyncio.Queue[DivineRequest] = asyncio.Queue()
+        # Single consumer (the prayer loop), so a plain deque plus an Event
+        # for the wakeup is enough — no asyncio.Queue getter futures
+        self._queue: collections.deque[DivineRequest] = collections.deque()
+        # Set while at least one request is queued — lets the consumer wait
+        # for work without taking it off the queue
+        self._not_empty = asyncio.Event()
+        # Dedup keys of requests waiting in the queue (not the one in flight)
+        self._pending: collections.Counter[tuple] = collections.Counter()
+
+    @staticmethod
+    def _dedup_key(request: DivineRequest) -> tuple:
+        return (request.player.lower(), request.request_type,
+                " ".join(request.message.lower().split()))
 
-    def enqueue(self, request: DivineRequest):
-        self._queue.put_nowait(request)
+    def enqueue(self, request: DivineRequest) -> bool:
+        """Queue a request. Returns False if an identical one is already waiting.
+
+        Players often repeat a prayer while the first is still queued; the god
+        answers the queued copy, so the repeat would only spend another LLM
+        call on the same question.
+
+        Raises asyncio.QueueFull once MAX_QUEUE_DEPTH requests are waiting —
+        the new request is refused rather than pushing out ones already
+        queued, so one player flooding prayers can't evict everyone else's.
+        """
+        key = self._dedup_key(request)
+        if self._pending[key]:
+            logger.info(
+                f"[{request.request_type}] Duplicate from {request.player} already queued, "
+                f"skipping: \"{request.message[:60]}\""
+            )
+            return False
+        if len(self._queue) >= MAX_QUEUE_DEPTH:
+            logger.warning(
+                f"[{request.request_type}] Queue full ({MAX_QUEUE_DEPTH}), refusing "
+                f"{request.player}: \"{request.message[:60]}\""
+            )
+            raise asyncio.QueueFull
+        self._pending[key] += 1
+        self._queue.append(request)
+        self._not_empty.set()
         logger.info(
             f"[{request.request_type}] Queued from {request.player}: "
-            f"\"{request.message[:60]}\" (queue depth: {self._queue.qsize()})"
+            f"\"{request.message[:60]}\" (queue depth: {len(self._queue)})"
         )
+        return True
 
     async def dequeue(self) -> DivineRequest:
         """Block until a request is available."""
-        return await self._queue.get()
+        await self.wait_for_request()
+        return self.dequeue_nowait()
+
+    async def wait_for_request(self):
+        """Block until a request is queued, leaving it on the queue."""
+        await self._not_empty.wait()
+
+    def dequeue_nowait(self) -> DivineRequest:
+        """Take the oldest request. Raises asyncio.QueueEmpty if there is none."""
+        if not self._queue:
+            raise asyncio.QueueEmpty
+        request = self._queue.popleft()
+        if not self._queue:
+            self._not_empty.clear()
+        key = self._dedup_key(request)
+        self._pending[key] -= 1
+        if not self._pending[key]:
+            del self._pending[key]
+        return request
 
     def requeue(self, request: DivineRequest) -> bool:
-        """Put a failed request back for retry. Returns False if abandoned."""
+        """Put a failed request back for retry. Returns False if abandoned.
+
+        Retries are not subject to MAX_QUEUE_DEPTH — the request was already
+        accepted, and the player is still waiting on it.
+        """
         request.attempts += 1
         if request.attempts < MAX_ATTEMPTS:
-            self._queue.put_nowait(request)
+            self._pending[self._dedup_key(request)] += 1
+            self._queue.append(request)
+            self._not_empty.set()
             logger.info(
                 f"[{request.request_type}] {request.player} requeued "
                 f"(attempt {request.attempts}/{MAX_ATTEMPTS})"
@@ -179,4 +279,4 @@ class DivineRequestQueue:
 
     @property
     def size(self) -> int:
-        return self._queue.qsize()
+        return len(self._queue)
@@ -5,6 +5,7 @@ for different command types (tellraw, build_schematic, plain commands),
 and log persistence (save/load roundtrip, error handling).
 """
 
+import asyncio
 import json
 import time
 from pathlib import Path
@@ -46,6 +47,16 @@ def test_log_activity_multiple_entries():
         main_module._consolidation_log.extend(original)
 
 
+def test_clock_reuses_formatting_within_a_second():
+    with patch.object(time, "time", return_value=1_000_000.2):
+        first = main_module._clock()
+    with patch.object(time, "time", return_value=1_000_000.9):
+        assert main_module._clock() is first
+    with patch.object(time, "time", return_value=1_000_001.0):
+        later = main_module._clock()
+    assert later == time.strftime("%H:%M:%S", time.localtime(1_000_001))
+
+
 # ---------------------------------------------------------------------------
 # _summarize_commands — short summary for the activity log
 # ---------------------------------------------------------------------------
@@ -100,6 +111,81 @@ def test_summarize_tellraw_fallback_on_malformed():
     assert "tellraw" in result
 
 
+# ---------------------------------------------------------------------------
+# _append_commands_log — /logs debug entries
+# ---------------------------------------------------------------------------
+
+
+def test_commands_log_entry_summarizes_each_command():
+    commands = [
+        {"type": "build_schematic", "blueprint_id": "tower", "x": 1, "y": 64, "z": 2},
+        {"command": "weather clear 6000"},
+    ]
+    with patch.object(main_module, "_recent_logs", main_module._RecentLogs(maxlen=50)):
+        main_module._append_commands_log({"action": "tick_acted"}, commands)
+        entry = main_module._recent_logs[-1]
+    assert entry["action"] == "tick_acted"
+    assert entry["commands"] == ["build_schematic(tower @ 1,64,2)", "weather clear 6000"]
+
+
+def test_log_recent_defers_entries_in_order():
+    async def _test():
+        main_module._log_recent({"time": "12:00:00", "action": "tick_acted"},
+                                [{"command": "weather clear 6000"}])
+        main_module._log_recent({"time": "12:00:00", "action": "tick_error", "error": "boom"})
+        assert len(main_module._recent_logs) == 0
+        await asyncio.sleep(0)
+        return list(main_module._recent_logs)
+
+    with patch.object(main_module, "_recent_logs", main_module._RecentLogs(maxlen=50)):
+        entries = asyncio.run(_test())
+    assert [e["action"] for e in entries] == ["tick_acted", "tick_error"]
+    assert entries[0]["commands"] == ["weather clear 6000"]
+    assert "commands" not in entries[1]
+
+
+def test_logs_endpoint_returns_entries_without_absent_fields():
+    with patch.object(main_module, "_recent_logs", main_module._RecentLogs(maxlen=50)):
+        main_module._recent_logs.append({"time": "12:00:00", "action": "tick_idle_skip",
+                                         "reason": "no_players_online"})
+        latest = asyncio.run(main_module.get_logs())[-1]
+    assert latest == {"time": "12:00:00", "action": "tick_idle_skip",
+                      "reason": "no_players_online"}
+
+
+def test_logs_ring_buffer_keeps_last_50():
+    with patch.object(main_module, "_recent_logs", main_module._RecentLogs(maxlen=50)):
+        for i in range(60):
+            main_module._recent_logs.append({"time": f"t{i}", "action": "tick_silent"})
+        logs = asyncio.run(main_module.get_logs())
+    assert len(logs) == 50
+    assert logs[0]["time"] == "t10"
+    assert logs[-1]["time"] == "t59"
+
+
+# ---------------------------------------------------------------------------
+# _ShuffleBag — interception flavor text
+# ---------------------------------------------------------------------------
+
+
+def test_shuffle_bag_deals_each_message_once_per_pass():
+    pool = ("a", "b", "c", "d")
+    bag = main_module._ShuffleBag(pool)
+    assert sorted(bag.draw() for _ in pool) == sorted(pool)
+    assert sorted(bag.draw() for _ in pool) == sorted(pool)
+
+
+def test_shuffle_bag_never_repeats_back_to_back():
+    bag = main_module._ShuffleBag(("a", "b", "c"))
+    draws = [bag.draw() for _ in range(300)]
+    assert all(x != y for x, y in zip(draws, draws[1:]))
+
+
+def test_shuffle_bag_single_message_pool():
+    bag = main_module._ShuffleBag(("only",))
+    assert [bag.draw() for _ in range(3)] == ["only", "only", "only"]
+
+
 # ---------------------------------------------------------------------------
 # _log_activity — cap enforcement
 # ---------------------------------------------------------------------------
@@ -104,6 +104,13 @@ def test_malformed_json_returns_error():
     assert "tc_bad" in errors
 
 
+def test_non_object_arguments_return_validation_error():
+    tc = _make_tool_call("set_time", ["day"], "tc_list")
+    commands, errors = translate_tool_calls([tc])
+    assert commands == []
+    assert errors["tc_list"].startswith("ERROR in set_time")
+
+
 # ---------------------------------------------------------------------------
 # send_message
 # ---------------------------------------------------------------------------
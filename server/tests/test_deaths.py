@@ -81,6 +81,24 @@ def test_get_deaths_unknown_player():
     assert dm.get_total_deaths("Nobody") == 0
 
 
+def test_death_counts_per_player():
+    dm = _make_memorial()
+    dm.record_death(_death_event("Steve"))
+    dm.record_death(_death_event("Steve"))
+    dm.record_death(_death_event("Alex"))
+    assert dm.death_counts() == {"Steve": 2, "Alex": 1}
+
+
+def test_player_deaths_is_a_snapshot():
+    """Readers iterate a copy, so a death recorded meanwhile can't disturb them."""
+    dm = _make_memorial()
+    dm.record_death(_death_event("Steve"))
+    deaths = dm.get_player_deaths("Steve")
+    dm.record_death(_death_event("Steve"))
+    assert len(deaths) == 1
+    assert dm.get_total_deaths("Steve") == 2
+
+
 def test_nearby_deaths():
     dm = _make_memorial()
     # Death at (100, 64, 100)
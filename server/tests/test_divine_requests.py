@@ -0,0 +1,114 @@
+"""Tests for divine request processing in main.py.
+
+Covers queuing a request (and telling the player when the queue is full),
+_process_divine_request's retry path — how a failed prayer is requeued and
+which gods are called again on the retry — and the bounded command queue
+the results land in.
+"""
+
+import asyncio
+import collections
+import logging
+import time
+from unittest.mock import AsyncMock, patch
+
+import server.main as main_module
+from server.prayer_queue import (
+    MAX_ATTEMPTS,
+    MAX_QUEUE_DEPTH,
+    DivineRequest,
+    DivineRequestQueue,
+)
+
+
+def _prayer(message: str = "god please help, herald guide me",
+            player: str = "Steve") -> DivineRequest:
+    return DivineRequest(
+        player=player,
+        message=message,
+        request_type="prayer",
+        timestamp=time.time(),
+        player_snapshot={},
+        recent_chat=[{"player": "Steve", "message": message}],
+    )
+
+
+# ---------------------------------------------------------------------------
+# _enqueue_divine_request
+# ---------------------------------------------------------------------------
+
+
+def test_enqueue_tells_player_when_queue_full():
+    queue = DivineRequestQueue()
+    commands = collections.deque()
+    with patch.object(main_module, "prayer_queue", queue), \
+            patch.object(main_module, "command_queue", commands):
+        for i in range(MAX_QUEUE_DEPTH):
+            main_module._enqueue_divine_request(_prayer(player=f"P{i}"))
+        assert not commands
+        main_module._enqueue_divine_request(_prayer(player="Alex"))
+
+    assert queue.size == MAX_QUEUE_DEPTH
+    assert len(commands) == 1
+    assert commands[0]["command"].startswith("tellraw Alex ")
+
+
+# ---------------------------------------------------------------------------
+# Failed prayers and the Herald
+# ---------------------------------------------------------------------------
+
+
+def test_herald_answers_failed_prayer_only_once():
+    """The Herald side-reply runs on the first attempt, not on every retry."""
+    async def _test():
+        queue = DivineRequestQueue()
+        commands = collections.deque()
+        kind_think = AsyncMock(return_value=None)
+        herald_think = AsyncMock(return_value=None)
+        with patch.object(main_module, "prayer_queue", queue), \
+                patch.object(main_module, "command_queue", commands), \
+                patch.object(main_module, "_recent_logs", main_module._RecentLogs(maxlen=50)), \
+                patch.object(main_module, "_consolidation_log", collections.deque()), \
+                patch.object(main_module.deep_god, "should_act", return_value=False), \
+                patch.object(main_module.kind_god, "think", kind_think), \
+                patch.object(main_module.herald_god, "think", herald_think), \
+                patch.object(main_module.herald_god, "_last_spoke", 0):
+            await main_module._process_divine_request(_prayer())
+            while queue.size:
+                await main_module._process_divine_request(queue.dequeue_nowait())
+
+        assert kind_think.await_count == MAX_ATTEMPTS
+        assert herald_think.await_count == 1
+
+    asyncio.run(_test())
+
+
+# ---------------------------------------------------------------------------
+# Command queue
+# ---------------------------------------------------------------------------
+
+
+def test_queue_commands_warns_when_full(caplog):
+    queue = collections.deque(maxlen=main_module._COMMAND_QUEUE_MAX)
+    with patch.object(main_module, "command_queue", queue):
+        main_module._queue_commands(
+            [{"command": f"say {i}"} for i in range(main_module._COMMAND_QUEUE_MAX)])
+        assert not caplog.records
+
+        with caplog.at_level(logging.WARNING, logger="minecraft-god"):
+            main_module._queue_commands([{"command": "say a"}, {"command": "say b"}])
+
+    assert len(queue) == main_module._COMMAND_QUEUE_MAX
+    assert queue[-1] == {"command": "say b"}
+    assert len(caplog.records) == 1
+    assert "dropping the 2 oldest" in caplog.records[0].getMessage()
+
+
+def test_get_commands_swaps_in_fresh_queue():
+    queue = collections.deque(maxlen=main_module._COMMAND_QUEUE_MAX)
+    queue.append({"command": "say hi"})
+    with patch.object(main_module, "command_queue", queue):
+        commands = asyncio.run(main_module.get_commands())
+        assert commands == [{"command": "say hi"}]
+        assert not main_module.command_queue
+        assert main_module.command_queue.maxlen == main_module._COMMAND_QUEUE_MAX
@@ -0,0 +1,60 @@
+"""Tests for the /event endpoint in main.py.
+
+Covers request body validation (missing type, non-object and malformed JSON
+bodies), the documented OpenAPI body schema, and activity logging of events
+that are accepted.
+"""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException, Request
+
+import server.main as main_module
+
+
+# ---------------------------------------------------------------------------
+# /event — body validation
+# ---------------------------------------------------------------------------
+
+
+def _event_request(body: bytes) -> Request:
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+    return Request({"type": "http", "method": "POST", "headers": []}, receive)
+
+
+def test_event_body_schema_documented():
+    body = main_module.app.openapi()["paths"]["/event"]["post"]["requestBody"]
+    schema = body["content"]["application/json"]["schema"]
+    assert schema["required"] == ["type"]
+
+
+def test_event_without_type_is_rejected():
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(main_module.receive_event(_event_request(b'{"player": "Steve"}')))
+    assert exc_info.value.status_code == 422
+
+
+def test_event_non_object_body_is_rejected():
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(main_module.receive_event(_event_request(b'["chat"]')))
+    assert exc_info.value.status_code == 422
+
+
+def test_event_join_is_logged_for_consolidation():
+    original = main_module._consolidation_log.copy()
+    try:
+        body = b'{"type": "player_join", "player": "Steve"}'
+        assert asyncio.run(main_module.receive_event(_event_request(body))) == {"status": "ok"}
+        assert main_module._consolidation_log[-1].endswith("JOIN: Steve joined the world")
+    finally:
+        main_module._consolidation_log.clear()
+        main_module._consolidation_log.extend(original)
+        main_module.event_buffer.drain_and_summarize()
+
+
+def test_event_malformed_json_is_rejected():
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(main_module.receive_event(_event_request(b"not json {")))
+    assert exc_info.value.status_code == 422
@@ -9,7 +9,7 @@ indefinitely and the gods keep calling the LLM with stale "player online" data.
 import time
 from unittest.mock import patch
 
-from server.events import EventBuffer
+from server.events import EventBuffer, find_player
 
 
 # ---------------------------------------------------------------------------
@@ -114,6 +114,23 @@ def test_drain_clears_events():
     assert buf.drain_and_summarize() is None
 
 
+def test_has_events_ignores_player_status():
+    """A status beacon alone does not count as a buffered event."""
+    buf = EventBuffer()
+    assert buf.has_events() is False
+    buf.add({"type": "player_status", "players": []})
+    assert buf.has_events() is False
+    buf.add({"type": "weather_change", "newWeather": "Rain"})
+    assert buf.has_events() is True
+
+
+def test_has_events_false_after_drain():
+    buf = EventBuffer()
+    buf.add({"type": "weather_change", "newWeather": "Rain"})
+    buf.drain_and_summarize()
+    assert buf.has_events() is False
+
+
 def test_drain_preserves_player_status():
     """Draining events does NOT clear the cached player status."""
     buf = EventBuffer()
@@ -161,3 +178,43 @@ def test_get_recent_chat_is_non_destructive():
     buf.get_recent_chat()
     summary = buf.drain_and_summarize()
     assert "hello" in summary
+
+
+def test_repeated_chat_line_buffered_once():
+    buf = EventBuffer()
+    for _ in range(3):
+        buf.add({"type": "chat", "player": "Steve", "message": "hello"})
+    buf.add({"type": "chat", "player": "Alex", "message": "hello"})
+    assert [c["player"] for c in buf.get_recent_chat()] == ["Steve", "Alex"]
+
+
+def test_repeated_chat_line_allowed_after_drain():
+    buf = EventBuffer()
+    buf.add({"type": "chat", "player": "Steve", "message": "hello"})
+    buf.drain_and_summarize()
+    buf.add({"type": "chat", "player": "Steve", "message": "hello"})
+    assert len(buf.get_recent_chat()) == 1
+
+
+def test_buffer_drops_oldest_events_past_cap():
+    buf = EventBuffer()
+    for i in range(EventBuffer._MAX_EVENTS + 10):
+        buf.add({"type": "block_break", "player": "Steve", "block": f"stone_{i}"})
+    assert len(buf._events) == EventBuffer._MAX_EVENTS
+    assert buf._events[0]["block"] == "stone_10"
+
+
+# ---------------------------------------------------------------------------
+# find_player
+# ---------------------------------------------------------------------------
+
+
+def test_find_player_is_case_insensitive():
+    status = {"type": "player_status", "players": [{"name": "Steve"}, {"name": "Alex"}]}
+    assert find_player(status, "alex") == {"name": "Alex"}
+
+
+def test_find_player_missing_returns_none():
+    status = {"type": "player_status", "players": [{"name": "Steve"}]}
+    assert find_player(status, "Alex") is None
+    assert find_player(None, "Steve") is None
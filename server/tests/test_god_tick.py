@@ -0,0 +1,70 @@
+"""Tests for the spontaneous god tick in main.py.
+
+Covers how _god_tick_inner handles a Kind/Deep God whose think() raises:
+players see the failure message and /logs records the exception, whether
+or not the Herald runs alongside it.
+"""
+
+import asyncio
+import collections
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import server.main as main_module
+
+
+def _run_tick(kind_think: AsyncMock, herald_acts: bool,
+              herald_think: AsyncMock | None = None):
+    """Run one tick with a player online and one buffered event.
+
+    Returns (queued commands, /logs entries).
+    """
+    buffer = MagicMock()
+    buffer.get_player_status.return_value = {"players": [{"name": "Steve"}]}
+    buffer.drain_and_summarize.return_value = "Steve mined some stone"
+    commands = collections.deque()
+    logs = main_module._RecentLogs(maxlen=50)
+
+    async def _test():
+        with patch.object(main_module, "event_buffer", buffer), \
+                patch.object(main_module, "command_queue", commands), \
+                patch.object(main_module, "_recent_logs", logs), \
+                patch.object(main_module, "_consolidation_log", collections.deque()), \
+                patch.object(main_module, "_maybe_consolidate", AsyncMock()), \
+                patch.object(main_module, "_build_player_context", return_value={}), \
+                patch.object(main_module.deep_god, "should_act", return_value=False), \
+                patch.object(main_module.herald_god, "should_act", return_value=herald_acts), \
+                patch.object(main_module.herald_god, "think",
+                             herald_think or AsyncMock(return_value=[])), \
+                patch.object(main_module.kind_god, "think", kind_think):
+            await main_module._god_tick_inner()
+            # Let deferred /logs appends run
+            await asyncio.sleep(0)
+
+    asyncio.run(_test())
+    return list(commands), list(logs)
+
+
+# ---------------------------------------------------------------------------
+# think() raising
+# ---------------------------------------------------------------------------
+
+
+def test_raising_god_reported_without_herald():
+    kind_think = AsyncMock(side_effect=RuntimeError("boom"))
+    commands, logs = _run_tick(kind_think, herald_acts=False)
+
+    assert commands == main_module._god_failure_commands("kind")
+    errors = [e for e in logs if e["action"] == "tick_error"]
+    assert errors == [{"time": errors[0]["time"], "god": "kind",
+                       "action": "tick_error", "error": "RuntimeError: boom"}]
+
+
+def test_raising_god_reported_with_herald():
+    kind_think = AsyncMock(side_effect=RuntimeError("boom"))
+    herald_think = AsyncMock(return_value=[{"command": "say verse"}])
+    commands, logs = _run_tick(kind_think, herald_acts=True, herald_think=herald_think)
+
+    assert commands[:-1] == main_module._god_failure_commands("kind")
+    assert commands[-1] == {"command": "say verse"}
+    errors = [e for e in logs if e["action"] == "tick_error"]
+    assert [e["error"] for e in errors] == ["RuntimeError: boom"]
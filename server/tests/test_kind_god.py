@@ -0,0 +1,62 @@
+"""Tests for the Kind God's prompt layout.
+
+The system prompt stays fixed across calls so the provider's prompt cache
+keeps hitting on it; memories lead the user turn instead. LLM calls are
+mocked at the client boundary.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from server.kind_god import SYSTEM_PROMPT, KindGod
+
+
+def _silent_response():
+    """Mock chat completion with no text and no tool calls."""
+    choice = MagicMock()
+    choice.message.content = None
+    choice.message.tool_calls = None
+    response = MagicMock()
+    response.choices = [choice]
+    return response
+
+
+def _sent_messages(memory_block: str) -> list[dict]:
+    """Run one think() with the given memory block; return the messages sent."""
+    with patch("server.kind_god.KindGodMemory") as memory_cls:
+        memory_cls.return_value.format_for_prompt.return_value = memory_block
+        god = KindGod()
+
+    create = AsyncMock(return_value=_silent_response())
+    with patch("server.kind_god.client") as mock_client:
+        mock_client.chat.completions.create = create
+        asyncio.run(god.think("Steve mined some stone"))
+
+    create.assert_awaited_once()
+    return create.await_args.kwargs["messages"]
+
+
+# ---------------------------------------------------------------------------
+# Prompt layout — memories in the user turn
+# ---------------------------------------------------------------------------
+
+
+def test_memories_lead_the_user_turn():
+    block = (
+        "\n\n=== YOUR MEMORIES ===\n"
+        "- Steve is a careful builder.\n"
+        "=== END MEMORIES ==="
+    )
+    messages = _sent_messages(block)
+
+    assert messages[0] == {"role": "system", "content": SYSTEM_PROMPT}
+    user = messages[1]
+    assert user["role"] == "user"
+    assert user["content"].startswith(block.lstrip("\n") + "\n\n=== WORLD UPDATE ===")
+
+
+def test_no_memories_adds_no_separator():
+    messages = _sent_messages("")
+
+    assert messages[0] == {"role": "system", "content": SYSTEM_PROMPT}
+    assert messages[1]["content"].startswith("=== WORLD UPDATE ===")
@@ -128,7 +128,7 @@ def test_save_creates_file(tmp_path):
 
 
 # ---------------------------------------------------------------------------
-# format_for_prompt — output for the Kind God system prompt
+# format_for_prompt — output for the Kind God prompt
 # ---------------------------------------------------------------------------
 
 
@@ -211,6 +211,22 @@ def test_consolidate_updates_memories(tmp_path):
     asyncio.run(_test())
 
 
+def test_consolidate_writes_memories_to_disk(tmp_path):
+    async def _test():
+        mem = _make_memory(tmp_path)
+        with patch("server.memory.client") as mock_client:
+            mock_client.chat.completions.create = AsyncMock(
+                return_value=_mock_llm_response('["Steve builds castles."]')
+            )
+            await mem.consolidate(["[12:00] Steve built a castle"])
+
+        data = json.loads(mem.memory_path.read_text())
+        assert data["consolidation_count"] == 1
+        assert data["memories"][0]["content"] == "Steve builds castles."
+
+    asyncio.run(_test())
+
+
 def test_consolidate_preserves_created_dates(tmp_path):
     """Unchanged memories keep their original created date."""
     async def _test():
@@ -8,10 +8,14 @@ DivineRequest.build_context(), and DivineRequestQueue.enqueue/dequeue/requeue.
 import asyncio
 import time
 
+import pytest
+
 from server.prayer_queue import (
     DivineRequest,
     DivineRequestQueue,
     MAX_ATTEMPTS,
+    MAX_QUEUE_DEPTH,
+    _keyword_pattern,
     classify_divine_request,
     is_divine_request,
 )
@@ -53,6 +57,21 @@ def test_classify_remember_takes_priority_over_herald():
     assert classify_divine_request("remember herald") == "remember"
 
 
+def test_classify_dig_keyword():
+    assert classify_divine_request("can someone dig a tunnel here") == "dig"
+
+
+def test_classify_dig_takes_priority_over_prayer():
+    """Dig beats prayer when both present; remember still beats dig."""
+    assert classify_divine_request("God please dig me a hole") == "dig"
+    assert classify_divine_request("remember the hole we dug") == "remember"
+
+
+def test_classify_matches_keyword_inside_word():
+    """Keywords match as substrings, not whole words ("godly" contains "god")."""
+    assert classify_divine_request("what a godly view") == "prayer"
+
+
 def test_classify_case_insensitive():
     assert classify_divine_request("GOD HELP ME") == "prayer"
     assert classify_divine_request("HERALD tell me") == "herald"
@@ -79,6 +98,17 @@ def test_classify_empty_string():
     assert classify_divine_request("") is None
 
 
+def test_keyword_pattern_prefers_longer_keyword():
+    assert _keyword_pattern({"pray", "prayer"}).search("a prayer").group() == "prayer"
+
+
+def test_classify_repeat_message_is_cached():
+    classify_divine_request("god please send rain")
+    hits = classify_divine_request.cache_info().hits
+    assert classify_divine_request("god please send rain") == "prayer"
+    assert classify_divine_request.cache_info().hits == hits + 1
+
+
 # ---------------------------------------------------------------------------
 # DivineRequest.build_context — context snapshot formatting
 # ---------------------------------------------------------------------------
@@ -230,6 +260,13 @@ def test_context_nearby_entities():
     assert "Nearby entities" in ctx
 
 
+def test_context_reused_across_retries():
+    req = _make_request(inventory={"dirt": 3, "stone": 10})
+    first = req.build_context()
+    req.attempts += 1
+    assert req.build_context() is first
+
+
 # ---------------------------------------------------------------------------
 # Queue operations
 # ---------------------------------------------------------------------------
@@ -299,3 +336,87 @@ def test_requeue_abandon_after_max_attempts():
         assert q.size == 0
 
     asyncio.run(_test())
+
+
+def test_wait_for_request_leaves_request_queued():
+    async def _test():
+        q = DivineRequestQueue()
+        q.enqueue(_make_request(player="Alice"))
+        await asyncio.wait_for(q.wait_for_request(), timeout=1)
+        assert q.size == 1
+        assert q.dequeue_nowait().player == "Alice"
+        assert q.size == 0
+
+    asyncio.run(_test())
+
+
+def test_wait_for_request_blocks_until_enqueue():
+    async def _test():
+        q = DivineRequestQueue()
+        waiter = asyncio.create_task(q.wait_for_request())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        q.enqueue(_make_request())
+        await asyncio.wait_for(waiter, timeout=1)
+
+    asyncio.run(_test())
+
+
+def test_wait_for_request_blocks_again_once_drained():
+    async def _test():
+        q = DivineRequestQueue()
+        q.enqueue(_make_request())
+        q.dequeue_nowait()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(q.wait_for_request(), timeout=0.01)
+
+    asyncio.run(_test())
+
+
+def test_enqueue_skips_identical_pending_request():
+    q = DivineRequestQueue()
+    assert q.enqueue(_make_request(player="Steve", message="god please heal me")) is True
+    assert q.enqueue(_make_request(player="steve", message="God please  heal me")) is False
+    assert q.size == 1
+
+
+def test_enqueue_allows_repeat_once_dequeued():
+    q = DivineRequestQueue()
+    q.enqueue(_make_request(player="Steve", message="god please heal me"))
+    q.dequeue_nowait()
+    assert q.enqueue(_make_request(player="Steve", message="god please heal me")) is True
+
+
+def test_enqueue_same_message_from_other_player():
+    q = DivineRequestQueue()
+    q.enqueue(_make_request(player="Steve", message="god please heal me"))
+    assert q.enqueue(_make_request(player="Alex", message="god please heal me")) is True
+    assert q.size == 2
+
+
+def test_dequeue_nowait_on_empty_queue_raises():
+    q = DivineRequestQueue()
+    with pytest.raises(asyncio.QueueEmpty):
+        q.dequeue_nowait()
+
+
+def test_enqueue_refuses_new_request_when_full():
+    q = DivineRequestQueue()
+    for i in range(MAX_QUEUE_DEPTH):
+        q.enqueue(_make_request(player=f"P{i}", message="god help"))
+    with pytest.raises(asyncio.QueueFull):
+        q.enqueue(_make_request(player="Flooder", message="god help"))
+    assert q.size == MAX_QUEUE_DEPTH
+    # Requests already queued are kept, oldest first
+    assert q.dequeue_nowait().player == "P0"
+
+
+def test_requeue_allowed_when_full():
+    """A failed request goes back for retry even if the queue filled meanwhile."""
+    q = DivineRequestQueue()
+    q.enqueue(_make_request(player="Steve", message="god help"))
+    retry = q.dequeue_nowait()
+    for i in range(MAX_QUEUE_DEPTH):
+        q.enqueue(_make_request(player=f"P{i}", message="god help"))
+    assert q.requeue(retry) is True
+    assert q.size == MAX_QUEUE_DEPTH + 1